@@ -10,30 +10,45 @@ from typing import Any
 @dataclass
 class ControlBridge:
     _lock: threading.Lock = field(default_factory=threading.Lock)
+    # Set by control requests so a sleeping orchestrator loop reacts immediately.
+    _wake: threading.Event = field(default_factory=threading.Event)
     stop_requested: bool = False
     safe_pause: bool = False
     safe_pause_reason: str = ""
     health_payload: dict[str, Any] = field(default_factory=dict)
     summary_payload: dict[str, Any] = field(default_factory=dict)
+    # JSON encodings already produced by the status writers, served as-is by the API.
+    health_body: bytes = b""
+    summary_body: bytes = b""
 
     def request_stop(self) -> None:
         with self._lock:
             self.stop_requested = True
+        self._wake.set()
 
     def request_pause(self, reason: str) -> None:
         with self._lock:
             self.safe_pause = True
             self.safe_pause_reason = reason.strip() or "manual_pause"
+        self._wake.set()
 
     def request_resume(self) -> None:
         with self._lock:
             self.safe_pause = False
             self.safe_pause_reason = ""
+        self._wake.set()
 
     def consume_stop(self) -> bool:
         with self._lock:
             return bool(self.stop_requested)
 
+    def wait_for_request(self, timeout: float) -> bool:
+        # Sleeps up to timeout; returns True early if a control request arrived.
+        woke = self._wake.wait(timeout=timeout)
+        if woke:
+            self._wake.clear()
+        return woke
+
     def snapshot(self) -> dict[str, Any]:
         with self._lock:
             return {
@@ -42,13 +57,15 @@ class ControlBridge:
                 "safe_pause_reason": self.safe_pause_reason,
             }
 
-    def update_health(self, payload: dict[str, Any]) -> None:
+    def update_health(self, payload: dict[str, Any], body: bytes = b"") -> None:
         with self._lock:
             self.health_payload = dict(payload)
+            self.health_body = body
 
-    def update_summary(self, payload: dict[str, Any]) -> None:
+    def update_summary(self, payload: dict[str, Any], body: bytes = b"") -> None:
         with self._lock:
             self.summary_payload = dict(payload)
+            self.summary_body = body
 
     def get_health(self) -> dict[str, Any]:
         with self._lock:
@@ -58,6 +75,20 @@ class ControlBridge:
         with self._lock:
             return dict(self.summary_payload)
 
+    def get_health_body(self) -> bytes:
+        with self._lock:
+            body, payload = self.health_body, self.health_payload
+        return body or _encode(payload)
+
+    def get_summary_body(self) -> bytes:
+        with self._lock:
+            body, payload = self.summary_body, self.summary_payload
+        return body or _encode(payload)
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=True).encode("utf-8")
+
 
 def _read_json_body(handler: BaseHTTPRequestHandler) -> dict[str, Any]:
     length = int(handler.headers.get("Content-Length", "0") or 0)
@@ -74,7 +105,9 @@ def _read_json_body(handler: BaseHTTPRequestHandler) -> dict[str, Any]:
 def _handler_factory(bridge: ControlBridge):
     class Handler(BaseHTTPRequestHandler):
         def _send(self, code: int, payload: dict[str, Any]) -> None:
-            body = json.dumps(payload, ensure_ascii=True).encode("utf-8")
+            self._send_body(code, _encode(payload))
+
+        def _send_body(self, code: int, body: bytes) -> None:
             self.send_response(code)
             self.send_header("Content-Type", "application/json")
             self.send_header("Content-Length", str(len(body)))
@@ -83,10 +116,10 @@ def _handler_factory(bridge: ControlBridge):
 
         def do_GET(self) -> None:  # noqa: N802
             if self.path == "/health":
-                self._send(200, bridge.get_health())
+                self._send_body(200, bridge.get_health_body())
                 return
             if self.path == "/summary/latest":
-                self._send(200, bridge.get_summary())
+                self._send_body(200, bridge.get_summary_body())
                 return
             self._send(404, {"error": "not_found"})
 
@@ -49,6 +49,7 @@ class LiveConfig:
     progress_training_mode: bool
     save_data_stale_minutes: float
     progress_stale_pause_minutes: float
+    include_unlock_lists: bool = True
 
 
 @dataclass(frozen=True)
@@ -262,6 +263,7 @@ def load_config(path: str | Path) -> AppConfig:
             progress_training_mode=bool(live.get("progress_training_mode", False)),
             save_data_stale_minutes=max(0.0, float(live.get("save_data_stale_minutes", 30.0))),
             progress_stale_pause_minutes=max(0.0, float(live.get("progress_stale_pause_minutes", 30.0))),
+            include_unlock_lists=bool(live.get("include_unlock_lists", True)),
         ),
         reporting=ReportingConfig(
             summary_dir=str(reporting.get("summary_dir", "runtime/summaries")),
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from datetime import datetime
-import json
 from pathlib import Path
 from typing import Any
 
+from .jsonio import dumps_bytes, write_bytes_atomic
 
-def write_json(path: Path, payload: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+
+def write_json(path: Path, payload: dict[str, Any]) -> bytes:
+    # Atomic replace so the dashboard never fetches a half-written file.
+    # Returns the encoded bytes so callers can reuse them instead of re-encoding.
+    data = dumps_bytes(payload, indent=True)
+    write_bytes_atomic(path, data)
+    return data
 
 
 def ensure_site(site_dir: Path) -> Path:
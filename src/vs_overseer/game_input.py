@@ -3,15 +3,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import json
+import os
 import re
 import subprocess
 from pathlib import Path
 import shutil
+import sys
 import tempfile
 import time
 from typing import Any
 
 from .config import AppConfig
+from .jsonio import write_bytes_atomic as _write_bytes_atomic
 
 
 KEY_CODE_MAP = {
@@ -31,7 +34,7 @@ KEY_CODE_MAP = {
     "w": "key code 13",
 }
 
-MENU_ACTIONABLE_STATES = {
+MENU_ACTIONABLE_STATES = frozenset({
     "title_screen",
     "main_menu",
     "character_select",
@@ -40,7 +43,7 @@ MENU_ACTIONABLE_STATES = {
     "game_over",
     "run_results",
     "level_up",
-}
+})
 
 MENU_FSM_TRANSITIONS: dict[str, set[str]] = {
     "unknown": {
@@ -68,7 +71,7 @@ MENU_FSM_TRANSITIONS: dict[str, set[str]] = {
     "run_results": {"run_results", "unknown", "main_menu", "character_select"},
 }
 
-MENU_FSM_KNOWN_STATES = set(MENU_FSM_TRANSITIONS.keys())
+MENU_FSM_KNOWN_STATES = frozenset(MENU_FSM_TRANSITIONS.keys())
 
 UPGRADE_SCORE_HINTS = {
     "empty tome": 120.0,
@@ -93,6 +96,42 @@ UPGRADE_SCORE_HINTS = {
 }
 
 
+MENU_KEYWORD_TOKENS = (
+    "press to start",
+    "start",
+    "game over",
+    "revive",
+    "quit",
+    "results",
+    "survived",
+    "enemies defeated",
+    "gold earned",
+    "level reached",
+    "level up",
+    "reroll",
+    "skip",
+    "banish",
+    "seal",
+    "character",
+    "stage",
+    "selection",
+    "resume",
+    "options",
+    "power up",
+    "collection",
+    "unlocks",
+    "bestiary",
+    "armory",
+    "login",
+    "linked",
+    "account",
+    "loading",
+)
+
+_OCR_NON_MATCH_RE = re.compile(r"[^a-z0-9:]+")
+_MENU_KEYWORD_RE = re.compile("|".join(re.escape(token) for token in MENU_KEYWORD_TOKENS))
+_RUN_TIMER_RE = re.compile(r"\b\d{1,2}:\d{2}\b")
+
 UNKNOWN_RUN_OCR_FRESH_SAVE_SECONDS = 20.0
 UNKNOWN_RUN_SAVE_HEARTBEAT_SECONDS = 2.5
 
@@ -115,6 +154,10 @@ CHARACTER_ROUTE = [
 ]
 
 
+_PROC_ROOT = Path("/proc")
+_PROC_MATCH_TTL_SECONDS = 5.0
+
+
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -123,11 +166,36 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _since(now_mono: float, start_mono: float) -> float:
+    # Unset timestamps are stored as 0.0 and count as no elapsed time.
+    return max(0.0, now_mono - start_mono) if start_mono > 0.0 else 0.0
+
+
 def _write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
-    tmp.replace(path)
+    _write_bytes_atomic(path, (json.dumps(payload, indent=2, ensure_ascii=True) + "\n").encode("ascii"))
+
+
+def _encode_json_line(payload: dict[str, Any]) -> bytes:
+    return (json.dumps(payload, ensure_ascii=True) + "\n").encode("ascii")
+
+
+def _proc_cmdline_contains(pid: int, needle: bytes) -> bool:
+    try:
+        fd = os.open(f"/proc/{pid}/cmdline", os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        chunks: list[bytes] = []
+        while True:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+    return needle in b"".join(chunks).replace(b"\0", b" ")
 
 
 def _read_json(path: Path) -> dict[str, Any]:
@@ -146,7 +214,7 @@ def _escape_osascript(value: str) -> str:
 
 def _normalize_ocr_match_text(raw: str) -> str:
     lowered = str(raw).lower()
-    cleaned = re.sub(r"[^a-z0-9:]+", " ", lowered)
+    cleaned = _OCR_NON_MATCH_RE.sub(" ", lowered)
     return " ".join(cleaned.split())
 
 
@@ -154,38 +222,7 @@ def _text_has_menu_keywords(raw: str) -> bool:
     normalized = _normalize_ocr_match_text(raw)
     if not normalized:
         return False
-    tokens = (
-        "press to start",
-        "start",
-        "game over",
-        "revive",
-        "quit",
-        "results",
-        "survived",
-        "enemies defeated",
-        "gold earned",
-        "level reached",
-        "level up",
-        "reroll",
-        "skip",
-        "banish",
-        "seal",
-        "character",
-        "stage",
-        "selection",
-        "resume",
-        "options",
-        "power up",
-        "collection",
-        "unlocks",
-        "bestiary",
-        "armory",
-        "login",
-        "linked",
-        "account",
-        "loading",
-    )
-    return any(token in normalized for token in tokens)
+    return _MENU_KEYWORD_RE.search(normalized) is not None
 
 
 def _subprocess_error_detail(completed: subprocess.CompletedProcess[str]) -> str:
@@ -464,6 +501,13 @@ class GameInputResult:
     payload: dict[str, Any]
 
 
+@dataclass(frozen=True)
+class SafetyState:
+    armed: bool
+    reason: str
+    menu_only: bool
+
+
 class GameInputDaemon:
     def __init__(
         self,
@@ -486,13 +530,13 @@ class GameInputDaemon:
         self.gameplay_enabled = bool(cfg.game_input.gameplay_enabled)
         self.gameplay_interval_seconds = max(0.2, float(cfg.game_input.gameplay_interval_seconds))
         self.gameplay_hold_seconds = max(0.05, float(cfg.game_input.gameplay_hold_seconds))
-        self.gameplay_sequence = [
+        self.gameplay_sequence = tuple(
             str(token).strip().lower()
             for token in cfg.game_input.gameplay_sequence
             if str(token).strip()
-        ]
+        )
         if not self.gameplay_sequence:
-            self.gameplay_sequence = ["left", "up", "right", "down"]
+            self.gameplay_sequence = ("left", "up", "right", "down")
         self.gameplay_confirm_enabled = bool(cfg.game_input.gameplay_confirm_enabled)
         self.gameplay_confirm_interval_seconds = max(0.2, float(cfg.game_input.gameplay_confirm_interval_seconds))
         self.gameplay_confirm_key = str(cfg.game_input.gameplay_confirm_key).strip().lower() or "return"
@@ -509,9 +553,11 @@ class GameInputDaemon:
         self.nudge_cooldown_seconds = max(0.0, float(cfg.game_input.nudge_cooldown_seconds))
         self.max_nudges_per_session = max(1, int(cfg.game_input.max_nudges_per_session))
         self.key_delay_seconds = max(0.05, float(cfg.game_input.key_delay_seconds))
-        self.sequence = [str(token).strip().lower() for token in cfg.game_input.title_nudge_sequence if str(token).strip()]
+        self.sequence = tuple(
+            str(token).strip().lower() for token in cfg.game_input.title_nudge_sequence if str(token).strip()
+        )
         if not self.sequence:
-            self.sequence = ["return", "return", "return", "return", "return"]
+            self.sequence = ("return", "return", "return", "return", "return")
         self.status_file = cfg.resolve(status_output_override or cfg.game_input.status_file)
         self.save_data_path = cfg.resolve(cfg.live.save_data_path) if str(cfg.live.save_data_path).strip() else None
         self.memory_signal_path = cfg.resolve(cfg.live.memory_signal_file) if str(cfg.live.memory_signal_file).strip() else None
@@ -586,8 +632,80 @@ class GameInputDaemon:
         self._last_objective_id = ""
         self._last_objective_change_mono = 0.0
         self._last_objective_change_at = ""
+        self._last_ok_state: bool | None = None
+        self._disabled_result: GameInputResult | None = None
+        self._proc_match_cache: dict[int, tuple[bool, float]] = {}
+        self._menu_keywords_excerpt: str | None = None
+        self._menu_keywords_found = False
+        self._status_template = self._build_status_template()
+
+    def _build_status_template(self) -> dict[str, Any]:
+        # Fields fixed for the lifetime of the daemon; tick() copies this and
+        # fills in the per-tick fields.
+        return {
+            "enabled": self.enabled,
+            "active": True,
+            "app_name": self.app_name,
+            "require_arm_file": self.require_arm_file,
+            "arm_file": str(self.arm_file),
+            "pause_when_unfocused": self.pause_when_unfocused,
+            "auto_launch_when_not_running": self.auto_launch_when_not_running,
+            "auto_launch_cooldown_seconds": self.auto_launch_cooldown_seconds,
+            "menu_detection_enabled": self.menu_detection_enabled,
+            "menu_scan_interval_seconds": self.menu_scan_interval_seconds,
+            "unknown_in_run_grace_seconds": self.unknown_in_run_grace_seconds,
+            "gameplay_enabled": self.gameplay_enabled,
+            "gameplay_interval_seconds": self.gameplay_interval_seconds,
+            "gameplay_hold_seconds": self.gameplay_hold_seconds,
+            "gameplay_sequence": self.gameplay_sequence,
+            "gameplay_confirm_enabled": self.gameplay_confirm_enabled,
+            "gameplay_confirm_interval_seconds": self.gameplay_confirm_interval_seconds,
+            "gameplay_confirm_key": self.gameplay_confirm_key,
+            "save_data_path": (str(self.save_data_path) if self.save_data_path is not None else ""),
+            "min_save_data_age_seconds": self.min_save_data_age_seconds,
+            "nudge_cooldown_seconds": self.nudge_cooldown_seconds,
+            "max_nudges_per_session": self.max_nudges_per_session,
+            "watch_interval_seconds": self.watch_interval_seconds,
+            "dry_run": self.dry_run,
+            "sequence": self.sequence,
+            "stuck_watchdog_enabled": self.stuck_watchdog_enabled,
+            "stuck_window_seconds": self.stuck_window_seconds,
+            "stuck_min_save_data_age_seconds": self.stuck_min_save_data_age_seconds,
+            "stuck_recovery_interval_seconds": self.stuck_recovery_interval_seconds,
+            "session_started_at": self._session_started_at,
+            "objective_stale_threshold_seconds": self.objective_stale_threshold_seconds,
+        }
 
-    def _find_game_pids(self) -> list[int]:
+    def _find_game_pids(self, *, now_mono: float | None = None) -> list[int]:
+        if _PROC_ROOT.is_dir():
+            return self._find_game_pids_proc(now_mono=time.monotonic() if now_mono is None else now_mono)
+        return self._find_game_pids_pgrep()
+
+    def _find_game_pids_proc(self, *, now_mono: float) -> list[int]:
+        # Same match as `pgrep -f`: app_name anywhere in the full command line.
+        # Verdicts are cached per pid, dropped as soon as the pid disappears and
+        # re-read after a short TTL so a later exec() in the same pid is noticed.
+        needle = self.app_name.encode("utf-8", "surrogateescape")
+        previous: dict[int, tuple[bool, float]] = getattr(self, "_proc_match_cache", {})
+        current: dict[int, tuple[bool, float]] = {}
+        try:
+            entries = os.scandir(_PROC_ROOT)
+        except OSError:
+            return self._find_game_pids_pgrep()
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not name.isdigit():
+                    continue
+                pid = int(name)
+                cached = previous.get(pid)
+                if cached is None or (now_mono - cached[1]) >= _PROC_MATCH_TTL_SECONDS:
+                    cached = (_proc_cmdline_contains(pid, needle), now_mono)
+                current[pid] = cached
+        self._proc_match_cache = current
+        return sorted(pid for pid, (matched, _checked) in current.items() if matched)
+
+    def _find_game_pids_pgrep(self) -> list[int]:
         try:
             completed = subprocess.run(
                 ["/usr/bin/pgrep", "-f", self.app_name],
@@ -830,13 +948,13 @@ class GameInputDaemon:
         self._gameplay_direction_index = (self._gameplay_direction_index + 1) % len(self.gameplay_sequence)
         return token
 
-    def _arm_state(self) -> tuple[bool, str, dict[str, Any]]:
+    def _arm_state(self) -> SafetyState:
         payload = _read_json(self.arm_file) if self.arm_file.exists() else {}
         ok, reason = _evaluate_arm_payload(
             require_arm_file=self.require_arm_file,
             payload=payload,
         )
-        return (ok, reason, payload)
+        return SafetyState(armed=ok, reason=reason, menu_only=bool(payload.get("menu_only", False)))
 
     def _window_capture_region(self) -> tuple[int, int, int, int] | None:
         script = (
@@ -1043,7 +1161,7 @@ class GameInputDaemon:
             return ("main_menu", "matched_main_menu_collection")
         if "vampire survivors" in normalized and ("power" in normalized or "start" in normalized):
             return ("main_menu", "matched_main_menu_logo")
-        if re.search(r"\b\d{1,2}:\d{2}\b", normalized):
+        if _RUN_TIMER_RE.search(normalized):
             blocked = (
                 "press to start",
                 "level up",
@@ -1485,17 +1603,46 @@ class GameInputDaemon:
         # Initial recovery: confirm through likely start prompt.
         return (list(self.sequence), "stuck_light")
 
+    def _emit_status(self, payload: dict[str, Any], *, notable: bool) -> None:
+        # Serialize once: the status file and the stdout log share the same line.
+        payload_bytes = _encode_json_line(payload)
+        # Only pay for fdatasync when the status actually transitions.
+        _write_bytes_atomic(self.status_file, payload_bytes, durable=notable)
+        stdout = getattr(sys.stdout, "buffer", None)
+        if stdout is not None:
+            stdout.write(payload_bytes)
+        else:
+            sys.stdout.write(payload_bytes.decode("ascii"))
+            stdout = sys.stdout
+        if notable:
+            stdout.flush()
+
     def tick(self, *, force: bool = False) -> GameInputResult:
+        if not self.enabled:
+            # Disabled is a terminal state for this process: nothing below can act,
+            # so after one full status pass only the timestamp is refreshed.
+            cached = getattr(self, "_disabled_result", None)
+            if cached is not None:
+                cached.payload["generated_at"] = utc_now_iso()
+                cached.payload["force"] = bool(force)
+                self._emit_status(cached.payload, notable=False)
+                return cached
+
+        # One clock read per tick: every *_mono and *_at field set below is
+        # stamped with the same instant.
         now_mono = time.monotonic()
-        pids = self._find_game_pids()
+        now_iso = utc_now_iso()
+        pids = self._find_game_pids(now_mono=now_mono)
         app_running = bool(pids)
         game_focused, focus_state_reason, frontmost_pid, frontmost_name = self._game_focus_state(
             app_running=app_running,
             pids=pids,
         )
         focus_pause_active = bool(self.pause_when_unfocused and app_running and (not game_focused))
-        safety_armed, safety_reason, safety_payload = self._arm_state()
-        safety_menu_only = bool(safety_payload.get("menu_only", False)) if isinstance(safety_payload, dict) else False
+        safety = self._arm_state()
+        safety_armed = safety.armed
+        safety_reason = safety.reason
+        safety_menu_only = safety.menu_only
 
         auto_launch_action = "none"
         auto_launch_error = ""
@@ -1511,7 +1658,7 @@ class GameInputDaemon:
         )
         if auto_launch_due:
             self._last_auto_launch_mono = now_mono
-            self._last_auto_launch_at = utc_now_iso()
+            self._last_auto_launch_at = now_iso
             self._auto_launch_attempts += 1
             if self.dry_run:
                 auto_launch_action = "launch_dry_run"
@@ -1525,7 +1672,7 @@ class GameInputDaemon:
                     auto_launch_action = "launch_error"
                     auto_launch_error = detail
                     self._last_auto_launch_error = detail
-            pids = self._find_game_pids()
+            pids = self._find_game_pids(now_mono=now_mono)
             app_running = bool(pids)
             game_focused, focus_state_reason, frontmost_pid, frontmost_name = self._game_focus_state(
                 app_running=app_running,
@@ -1534,18 +1681,20 @@ class GameInputDaemon:
             focus_pause_active = bool(self.pause_when_unfocused and app_running and (not game_focused))
 
         self._refresh_menu_state(now_mono=now_mono, app_running=app_running)
+        input_enabled = bool(self.enabled and safety_armed and (not focus_pause_active))
+        input_ready = input_enabled and app_running
+        menu_state = self._menu_state
+        menu_actionable = menu_state in MENU_ACTIONABLE_STATES
         objective_context = self._objective_context()
         objective_id = str(objective_context.get("next_objective_id", "") or "")
         if objective_id != self._last_objective_id:
             self._last_objective_id = objective_id
             self._last_objective_change_mono = now_mono
-            self._last_objective_change_at = utc_now_iso()
+            self._last_objective_change_at = now_iso
         elif self._last_objective_change_mono <= 0.0:
             self._last_objective_change_mono = now_mono
-            self._last_objective_change_at = utc_now_iso()
-        objective_staleness_seconds = (
-            max(0.0, now_mono - self._last_objective_change_mono) if self._last_objective_change_mono > 0.0 else 0.0
-        )
+            self._last_objective_change_at = now_iso
+        objective_staleness_seconds = _since(now_mono, self._last_objective_change_mono)
         objective_stale = objective_staleness_seconds >= self.objective_stale_threshold_seconds
         memory_context = self._memory_signal_context()
         self._refresh_menu_targets(
@@ -1555,12 +1704,12 @@ class GameInputDaemon:
         next_objective_candidate_source = (
             "objective_planner_queue"
             if objective_id != ""
-            else f"route_fallback:{self._target_stage_reason}"
+            else sys.intern(f"route_fallback:{self._target_stage_reason}")
         )
-        if self._menu_state == "in_run":
+        if menu_state == "in_run":
             self._last_in_run_seen_mono = now_mono
-            self._last_in_run_seen_at = utc_now_iso()
-        elif self._menu_state in MENU_ACTIONABLE_STATES:
+            self._last_in_run_seen_at = now_iso
+        elif menu_actionable:
             self._last_in_run_seen_mono = 0.0
             self._last_in_run_seen_at = ""
         in_run_recent = bool(
@@ -1574,12 +1723,12 @@ class GameInputDaemon:
             if self._last_seen_save_mtime <= 0.0:
                 self._last_seen_save_mtime = float(save_mtime)
                 self._last_save_change_mono = now_mono
-                self._last_save_change_at = utc_now_iso()
+                self._last_save_change_at = now_iso
             elif float(save_mtime) > (self._last_seen_save_mtime + 1e-6):
                 save_mtime_changed = True
                 self._last_seen_save_mtime = float(save_mtime)
                 self._last_save_change_mono = now_mono
-                self._last_save_change_at = utc_now_iso()
+                self._last_save_change_at = now_iso
                 # New save write means the game is making progress again.
                 self._nudges_sent = 0
                 self._last_stuck_nudge_mono = 0.0
@@ -1592,23 +1741,19 @@ class GameInputDaemon:
             if progress_signature != self._last_progress_signature:
                 self._last_progress_signature = progress_signature
                 self._last_progress_change_mono = now_mono
-                self._last_progress_change_at = utc_now_iso()
+                self._last_progress_change_at = now_iso
                 progress_signature_changed = True
             elif self._last_progress_change_mono <= 0.0:
                 self._last_progress_change_mono = now_mono
-                self._last_progress_change_at = utc_now_iso()
+                self._last_progress_change_at = now_iso
 
-        stuck_elapsed_seconds = (
-            max(0.0, now_mono - self._last_progress_change_mono) if self._last_progress_change_mono > 0.0 else 0.0
-        )
+        stuck_elapsed_seconds = _since(now_mono, self._last_progress_change_mono)
         stuck_recovery_remaining_seconds = (
-            max(0.0, self.stuck_recovery_interval_seconds - (now_mono - self._last_stuck_nudge_mono))
+            max(0.0, self.stuck_recovery_interval_seconds - _since(now_mono, self._last_stuck_nudge_mono))
             if self._last_stuck_nudge_mono > 0.0
             else 0.0
         )
-        save_stall_elapsed_seconds = (
-            max(0.0, now_mono - self._last_save_change_mono) if self._last_save_change_mono > 0.0 else 0.0
-        )
+        save_stall_elapsed_seconds = _since(now_mono, self._last_save_change_mono)
         stuck_watchdog_active = False
         stuck_watchdog_reason = "inactive"
         if not self.stuck_watchdog_enabled:
@@ -1629,12 +1774,20 @@ class GameInputDaemon:
             stuck_watchdog_active = True
             stuck_watchdog_reason = "stuck_progress_detected"
 
+        input_paused_reason = ""
         if not self.enabled:
-            should_nudge, reason, cooldown_remaining = (False, "disabled_by_config", 0.0)
+            input_paused_reason = "disabled_by_config"
         elif not safety_armed:
-            should_nudge, reason, cooldown_remaining = (False, f"safety_switch:{safety_reason}", 0.0)
+            # safety_reason comes from a fixed vocabulary, so the prefixed form is
+            # interned once instead of being rebuilt every tick.
+            input_paused_reason = sys.intern(f"safety_switch:{safety_reason}")
         elif focus_pause_active:
-            should_nudge, reason, cooldown_remaining = (False, f"paused_unfocused:{focus_state_reason}", 0.0)
+            input_paused_reason = f"paused_unfocused:{focus_state_reason}"
+        elif not app_running:
+            input_paused_reason = "game_not_running"
+
+        if not input_enabled:
+            should_nudge, reason, cooldown_remaining = (False, input_paused_reason, 0.0)
         else:
             should_nudge, reason, cooldown_remaining = evaluate_nudge(
                 enabled=True,
@@ -1651,8 +1804,7 @@ class GameInputDaemon:
         if (
             safety_armed
             and (not focus_pause_active)
-            and
-            stuck_watchdog_active
+            and stuck_watchdog_active
             and (not should_nudge)
             and reason not in {"disabled_by_config", "game_not_running"}
         ):
@@ -1660,33 +1812,30 @@ class GameInputDaemon:
             reason = "stuck_watchdog"
             cooldown_remaining = 0.0
 
-        input_paused_reason = ""
-        if not self.enabled:
-            input_paused_reason = "disabled_by_config"
-        elif not safety_armed:
-            input_paused_reason = f"safety_switch:{safety_reason}"
-        elif focus_pause_active:
-            input_paused_reason = f"paused_unfocused:{focus_state_reason}"
-        elif not app_running:
-            input_paused_reason = "game_not_running"
-
         menu_action = "none"
         menu_action_error = ""
         menu_action_sent = False
-        if self.enabled and safety_armed and (not focus_pause_active) and app_running and self._menu_state in MENU_ACTIONABLE_STATES:
+        if input_ready and menu_actionable:
             menu_action, menu_action_error, menu_action_sent = self._dispatch_menu_action(
-                menu_state=self._menu_state,
+                menu_state=menu_state,
                 now_mono=now_mono,
             )
             if menu_action_sent and menu_action_error == "":
                 self._last_error = ""
                 self._last_error_at = ""
 
-        unknown_excerpt = str(self._menu_text_excerpt).strip()
-        unknown_has_menu_keywords = _text_has_menu_keywords(unknown_excerpt)
+        # The excerpt only changes on a menu scan, so reuse the keyword verdict
+        # until a new excerpt object is stored.
+        excerpt = self._menu_text_excerpt
+        if excerpt is getattr(self, "_menu_keywords_excerpt", None):
+            unknown_has_menu_keywords = self._menu_keywords_found
+        else:
+            unknown_has_menu_keywords = _text_has_menu_keywords(str(excerpt).strip())
+            self._menu_keywords_excerpt = excerpt
+            self._menu_keywords_found = unknown_has_menu_keywords
         unknown_menu_confirm_allowed = bool(
             _should_allow_unknown_menu_confirm(
-                menu_state=self._menu_state,
+                menu_state=menu_state,
                 menu_ocr_ok=self._menu_ocr_ok,
                 unknown_has_menu_keywords=unknown_has_menu_keywords,
                 menu_ocr_error=self._menu_ocr_error,
@@ -1696,10 +1845,7 @@ class GameInputDaemon:
             )
         )
         unknown_menu_confirm_allowed = bool(
-            self.enabled
-            and safety_armed
-            and (not focus_pause_active)
-            and app_running
+            input_ready
             and self.menu_detection_enabled
             and unknown_menu_confirm_allowed
         )
@@ -1744,13 +1890,13 @@ class GameInputDaemon:
                     action = "nudge_error"
                     error = str(exc)
                     self._last_error = error
-                    self._last_error_at = utc_now_iso()
+                    self._last_error_at = now_iso
                     # Back off after failed injections to avoid tight retry loops/spam.
                     self._last_nudge_mono = now_mono
 
             if action in {"nudge_sent", "nudge_dry_run"}:
                 self._last_nudge_mono = now_mono
-                self._last_nudge_at = utc_now_iso()
+                self._last_nudge_at = now_iso
                 self._nudges_sent += 1
                 self._last_error = ""
                 self._last_error_at = ""
@@ -1762,7 +1908,7 @@ class GameInputDaemon:
         unknown_run_candidate_reason = "classifier"
         unknown_run_candidate = bool(
             _should_treat_unknown_as_in_run(
-                menu_state=self._menu_state,
+                menu_state=menu_state,
                 menu_ocr_ok=self._menu_ocr_ok,
                 unknown_has_menu_keywords=unknown_has_menu_keywords,
                 menu_ocr_error=self._menu_ocr_error,
@@ -1777,7 +1923,7 @@ class GameInputDaemon:
             and (now_mono - self._last_known_menu_state_mono) <= 20.0
         )
         if (
-            self._menu_state == "unknown"
+            menu_state == "unknown"
             and (not unknown_has_menu_keywords)
             and (not unknown_run_candidate)
             and (not menu_recently_observed)
@@ -1785,7 +1931,7 @@ class GameInputDaemon:
             unknown_run_candidate = True
             unknown_run_candidate_reason = "unknown_no_menu_keywords"
         if (
-            self._menu_state == "unknown"
+            menu_state == "unknown"
             and (not unknown_has_menu_keywords)
             and (not unknown_run_candidate)
         ):
@@ -1802,17 +1948,13 @@ class GameInputDaemon:
                 unknown_run_candidate_reason = "persist_recent_gameplay"
         gameplay_allowed_state = (
             (not self.menu_detection_enabled)
-            or (self._menu_state == "in_run")
+            or (menu_state == "in_run")
             or unknown_run_candidate
         )
         gameplay_due = (
-            self.enabled
-            and safety_armed
-            and (not focus_pause_active)
+            input_ready
             and (not safety_menu_only)
-            and
-            self.gameplay_enabled
-            and app_running
+            and self.gameplay_enabled
             and gameplay_allowed_state
             and (
                 self._last_gameplay_mono <= 0.0
@@ -1824,14 +1966,14 @@ class GameInputDaemon:
             if self.dry_run:
                 gameplay_action = "pulse_dry_run"
                 self._last_gameplay_mono = now_mono
-                self._last_gameplay_at = utc_now_iso()
+                self._last_gameplay_at = now_iso
                 self._last_gameplay_direction = gameplay_direction
             else:
                 try:
                     self._dispatch_movement_hold(gameplay_direction, self.gameplay_hold_seconds)
                     gameplay_action = "pulse_sent"
                     self._last_gameplay_mono = now_mono
-                    self._last_gameplay_at = utc_now_iso()
+                    self._last_gameplay_at = now_iso
                     self._last_gameplay_direction = gameplay_direction
                     self._gameplay_pulses_sent += 1
 
@@ -1856,7 +1998,7 @@ class GameInputDaemon:
                     gameplay_action = "pulse_error"
                     gameplay_error = str(exc)
                     self._gameplay_last_error = gameplay_error
-                    self._gameplay_last_error_at = utc_now_iso()
+                    self._gameplay_last_error_at = now_iso
                     self._last_error = f"gameplay:{gameplay_error}"
                     self._last_error_at = self._gameplay_last_error_at
 
@@ -1868,139 +2010,122 @@ class GameInputDaemon:
             and self._gameplay_last_error == ""
         )
 
-        payload = {
-            "generated_at": utc_now_iso(),
-            "enabled": self.enabled,
-            "active": True,
-            "ok": ok_state,
-            "app_name": self.app_name,
-            "app_running": app_running,
-            "pids": pids,
-            "require_arm_file": self.require_arm_file,
-            "arm_file": str(self.arm_file),
-            "safety_armed": safety_armed,
-            "safety_reason": safety_reason,
-            "safety_menu_only": safety_menu_only,
-            "pause_when_unfocused": self.pause_when_unfocused,
-            "game_focused": game_focused,
-            "focus_state_reason": focus_state_reason,
-            "focus_pause_active": focus_pause_active,
-            "input_paused_reason": input_paused_reason,
-            "frontmost_app_name": frontmost_name,
-            "frontmost_app_pid": frontmost_pid,
-            "effective_input_enabled": bool(self.enabled and safety_armed and (not focus_pause_active)),
-            "auto_launch_when_not_running": self.auto_launch_when_not_running,
-            "auto_launch_cooldown_seconds": self.auto_launch_cooldown_seconds,
-            "auto_launch_action": auto_launch_action,
-            "auto_launch_due": auto_launch_due,
-            "auto_launch_error": auto_launch_error,
-            "last_auto_launch_at": self._last_auto_launch_at,
-            "last_auto_launch_error": self._last_auto_launch_error,
-            "auto_launch_attempts": self._auto_launch_attempts,
-            "menu_detection_enabled": self.menu_detection_enabled,
-            "menu_scan_interval_seconds": self.menu_scan_interval_seconds,
-            "fsm_state": self._fsm_state,
-            "fsm_previous_state": self._fsm_prev_state,
-            "fsm_last_transition_reason": self._fsm_last_transition_reason,
-            "fsm_last_transition_at": self._fsm_last_transition_at,
-            "fsm_blocked_transitions": self._fsm_blocked_transitions,
-            "menu_state": self._menu_state,
-            "menu_state_reason": self._menu_state_reason,
-            "in_run_recent": in_run_recent,
-            "last_in_run_seen_at": self._last_in_run_seen_at,
-            "unknown_in_run_grace_seconds": self.unknown_in_run_grace_seconds,
-            "menu_target_stage_key": self._target_stage_key,
-            "menu_target_stage_index": self._target_stage_index,
-            "menu_target_stage_reason": self._target_stage_reason,
-            "menu_target_character_key": self._target_character_key,
-            "menu_target_character_index": self._target_character_index,
-            "menu_target_character_reason": self._target_character_reason,
-            "menu_ocr_ok": self._menu_ocr_ok,
-            "menu_ocr_error": self._menu_ocr_error,
-            "menu_last_scan_at": self._menu_last_scan_at,
-            "menu_capture_mode": self._menu_capture_mode,
-            "menu_text_excerpt": self._menu_text_excerpt,
-            "menu_unknown_has_menu_keywords": unknown_has_menu_keywords,
-            "menu_unknown_confirm_allowed": unknown_menu_confirm_allowed,
-            "menu_action": menu_action,
-            "menu_action_error": menu_action_error,
-            "menu_upgrade_choice_index": self._menu_upgrade_choice_index,
-            "menu_upgrade_choice_reason": self._menu_upgrade_choice_reason,
-            "gameplay_enabled": self.gameplay_enabled,
-            "gameplay_interval_seconds": self.gameplay_interval_seconds,
-            "gameplay_hold_seconds": self.gameplay_hold_seconds,
-            "gameplay_sequence": list(self.gameplay_sequence),
-            "gameplay_allowed_state": gameplay_allowed_state,
-            "gameplay_unknown_run_candidate": unknown_run_candidate,
-            "gameplay_unknown_run_candidate_reason": unknown_run_candidate_reason,
-            "gameplay_action": gameplay_action,
-            "gameplay_direction": gameplay_direction,
-            "last_gameplay_direction": self._last_gameplay_direction,
-            "gameplay_confirm_enabled": self.gameplay_confirm_enabled,
-            "gameplay_confirm_interval_seconds": self.gameplay_confirm_interval_seconds,
-            "gameplay_confirm_key": self.gameplay_confirm_key,
-            "gameplay_confirm_sent": gameplay_confirm_sent,
-            "gameplay_pulses_sent": self._gameplay_pulses_sent,
-            "last_gameplay_at": self._last_gameplay_at,
-            "gameplay_error": gameplay_error,
-            "last_gameplay_error": self._gameplay_last_error,
-            "last_gameplay_error_at": self._gameplay_last_error_at,
-            "save_data_path": (str(self.save_data_path) if self.save_data_path is not None else ""),
-            "save_data_age_seconds": save_age,
-            "min_save_data_age_seconds": self.min_save_data_age_seconds,
-            "nudge_cooldown_seconds": self.nudge_cooldown_seconds,
-            "cooldown_remaining_seconds": cooldown_remaining,
-            "nudges_sent": self._nudges_sent,
-            "max_nudges_per_session": self.max_nudges_per_session,
-            "last_nudge_at": self._last_nudge_at,
-            "watch_interval_seconds": self.watch_interval_seconds,
-            "dry_run": self.dry_run,
-            "force": bool(force),
-            "sequence": list(self.sequence),
-            "sequence_used": selected_sequence,
-            "sequence_label": sequence_label,
-            "decision_reason": reason,
-            "action": action,
-            "error": error,
-            "last_error": self._last_error,
-            "last_error_at": self._last_error_at,
-            "stuck_watchdog_enabled": self.stuck_watchdog_enabled,
-            "stuck_watchdog_active": stuck_watchdog_active,
-            "stuck_watchdog_reason": stuck_watchdog_reason,
-            "stuck_window_seconds": self.stuck_window_seconds,
-            "stuck_min_save_data_age_seconds": self.stuck_min_save_data_age_seconds,
-            "stuck_recovery_interval_seconds": self.stuck_recovery_interval_seconds,
-            "stuck_recovery_remaining_seconds": stuck_recovery_remaining_seconds,
-            "stuck_elapsed_seconds": stuck_elapsed_seconds,
-            "recovery_tier": recovery_tier,
-            "recovery_reason": recovery_reason,
-            "recovery_cooldown_remaining_seconds": stuck_recovery_remaining_seconds,
-            "save_stall_elapsed_seconds": save_stall_elapsed_seconds,
-            "save_mtime_changed": save_mtime_changed,
-            "last_save_change_at": self._last_save_change_at,
-            "progress_signature_present": bool(progress_signature is not None),
-            "progress_signature_changed": progress_signature_changed,
-            "last_progress_change_at": self._last_progress_change_at,
-            "triad_progress_any_gain": triad_progress_any_gain,
-            "session_started_at": self._session_started_at,
-            "objective_stale_threshold_seconds": self.objective_stale_threshold_seconds,
-            "objective_staleness_seconds": objective_staleness_seconds,
-            "objective_stale": objective_stale,
-            "last_objective_id": self._last_objective_id,
-            "last_objective_change_at": self._last_objective_change_at,
-            "next_objective_candidate_source": next_objective_candidate_source,
-            "objective_context": objective_context,
-            "memory_context": memory_context,
-        }
-        _write_json_atomic(self.status_file, payload)
-        print(json.dumps(payload, ensure_ascii=True))
-        return GameInputResult(ok=bool(payload.get("ok", False)), payload=payload)
+        payload = self._status_template.copy()
+        payload["generated_at"] = utc_now_iso()
+        payload["ok"] = ok_state
+        payload["app_running"] = app_running
+        payload["pids"] = pids
+        payload["safety_armed"] = safety_armed
+        payload["safety_reason"] = safety_reason
+        payload["safety_menu_only"] = safety_menu_only
+        payload["game_focused"] = game_focused
+        payload["focus_state_reason"] = focus_state_reason
+        payload["focus_pause_active"] = focus_pause_active
+        payload["input_paused_reason"] = input_paused_reason
+        payload["frontmost_app_name"] = frontmost_name
+        payload["frontmost_app_pid"] = frontmost_pid
+        payload["effective_input_enabled"] = input_enabled
+        payload["auto_launch_action"] = auto_launch_action
+        payload["auto_launch_due"] = auto_launch_due
+        payload["auto_launch_error"] = auto_launch_error
+        payload["last_auto_launch_at"] = self._last_auto_launch_at
+        payload["last_auto_launch_error"] = self._last_auto_launch_error
+        payload["auto_launch_attempts"] = self._auto_launch_attempts
+        payload["fsm_state"] = self._fsm_state
+        payload["fsm_previous_state"] = self._fsm_prev_state
+        payload["fsm_last_transition_reason"] = self._fsm_last_transition_reason
+        payload["fsm_last_transition_at"] = self._fsm_last_transition_at
+        payload["fsm_blocked_transitions"] = self._fsm_blocked_transitions
+        payload["menu_state"] = self._menu_state
+        payload["menu_state_reason"] = self._menu_state_reason
+        payload["in_run_recent"] = in_run_recent
+        payload["last_in_run_seen_at"] = self._last_in_run_seen_at
+        payload["menu_target_stage_key"] = self._target_stage_key
+        payload["menu_target_stage_index"] = self._target_stage_index
+        payload["menu_target_stage_reason"] = self._target_stage_reason
+        payload["menu_target_character_key"] = self._target_character_key
+        payload["menu_target_character_index"] = self._target_character_index
+        payload["menu_target_character_reason"] = self._target_character_reason
+        payload["menu_ocr_ok"] = self._menu_ocr_ok
+        payload["menu_ocr_error"] = self._menu_ocr_error
+        payload["menu_last_scan_at"] = self._menu_last_scan_at
+        payload["menu_capture_mode"] = self._menu_capture_mode
+        payload["menu_text_excerpt"] = self._menu_text_excerpt
+        payload["menu_unknown_has_menu_keywords"] = unknown_has_menu_keywords
+        payload["menu_unknown_confirm_allowed"] = unknown_menu_confirm_allowed
+        payload["menu_action"] = menu_action
+        payload["menu_action_error"] = menu_action_error
+        payload["menu_upgrade_choice_index"] = self._menu_upgrade_choice_index
+        payload["menu_upgrade_choice_reason"] = self._menu_upgrade_choice_reason
+        payload["gameplay_allowed_state"] = gameplay_allowed_state
+        payload["gameplay_unknown_run_candidate"] = unknown_run_candidate
+        payload["gameplay_unknown_run_candidate_reason"] = unknown_run_candidate_reason
+        payload["gameplay_action"] = gameplay_action
+        payload["gameplay_direction"] = gameplay_direction
+        payload["last_gameplay_direction"] = self._last_gameplay_direction
+        payload["gameplay_confirm_sent"] = gameplay_confirm_sent
+        payload["gameplay_pulses_sent"] = self._gameplay_pulses_sent
+        payload["last_gameplay_at"] = self._last_gameplay_at
+        payload["gameplay_error"] = gameplay_error
+        payload["last_gameplay_error"] = self._gameplay_last_error
+        payload["last_gameplay_error_at"] = self._gameplay_last_error_at
+        payload["save_data_age_seconds"] = save_age
+        payload["cooldown_remaining_seconds"] = cooldown_remaining
+        payload["nudges_sent"] = self._nudges_sent
+        payload["last_nudge_at"] = self._last_nudge_at
+        payload["force"] = bool(force)
+        payload["sequence_used"] = selected_sequence
+        payload["sequence_label"] = sequence_label
+        payload["decision_reason"] = reason
+        payload["action"] = action
+        payload["error"] = error
+        payload["last_error"] = self._last_error
+        payload["last_error_at"] = self._last_error_at
+        payload["stuck_watchdog_active"] = stuck_watchdog_active
+        payload["stuck_watchdog_reason"] = stuck_watchdog_reason
+        payload["stuck_recovery_remaining_seconds"] = stuck_recovery_remaining_seconds
+        payload["stuck_elapsed_seconds"] = stuck_elapsed_seconds
+        payload["recovery_tier"] = recovery_tier
+        payload["recovery_reason"] = recovery_reason
+        payload["recovery_cooldown_remaining_seconds"] = stuck_recovery_remaining_seconds
+        payload["save_stall_elapsed_seconds"] = save_stall_elapsed_seconds
+        payload["save_mtime_changed"] = save_mtime_changed
+        payload["last_save_change_at"] = self._last_save_change_at
+        payload["progress_signature_present"] = bool(progress_signature is not None)
+        payload["progress_signature_changed"] = progress_signature_changed
+        payload["last_progress_change_at"] = self._last_progress_change_at
+        payload["triad_progress_any_gain"] = triad_progress_any_gain
+        payload["objective_staleness_seconds"] = objective_staleness_seconds
+        payload["objective_stale"] = objective_stale
+        payload["last_objective_id"] = self._last_objective_id
+        payload["last_objective_change_at"] = self._last_objective_change_at
+        payload["next_objective_candidate_source"] = next_objective_candidate_source
+        payload["objective_context"] = objective_context
+        payload["memory_context"] = memory_context
+        state_changed = ok_state != getattr(self, "_last_ok_state", None)
+        self._last_ok_state = ok_state
+        self._emit_status(
+            payload,
+            notable=bool(state_changed or action != "none" or menu_action != "none" or gameplay_action != "none"),
+        )
+        result = GameInputResult(ok=bool(payload.get("ok", False)), payload=payload)
+        if not self.enabled:
+            self._disabled_result = result
+        return result
 
     def run_forever(self, *, force: bool = False) -> None:
         wait_s = max(0.2, float(self.watch_interval_seconds))
+        deadline = time.monotonic()
         while True:
             _ = self.tick(force=force)
-            time.sleep(wait_s)
+            # Schedule against absolute deadlines so tick time does not add drift;
+            # after an overrun, restart the cadence instead of bursting to catch up.
+            deadline += wait_s
+            remaining = deadline - time.monotonic()
+            if remaining > 0.0:
+                time.sleep(remaining)
+            else:
+                deadline = time.monotonic()
 
 
 def run_game_input_once(
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json is the fallback.
+    orjson = None  # type: ignore[assignment]
+
+
+def _require_finite(payload: Any) -> None:
+    # orjson silently writes NaN/Infinity as null; reject them as stdlib json does with allow_nan=False.
+    stack = [payload]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                raise ValueError("Out of range float values are not JSON compliant")
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+
+
+# Both encoders emit UTF-8 bytes with a trailing newline (unless newline=False) and
+# raise ValueError on NaN/Infinity. stdlib keeps ensure_ascii, so non-ASCII text differs
+# in bytes but decodes the same. Non-string keys are stringified by both, as stdlib json always did.
+def dumps_bytes(payload: Any, *, indent: bool = False, newline: bool = True) -> bytes:
+    if orjson is not None:
+        _require_finite(payload)
+        option = orjson.OPT_NON_STR_KEYS
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option)
+    if indent:
+        text = json.dumps(payload, indent=2, ensure_ascii=True, allow_nan=False)
+    else:
+        text = json.dumps(payload, ensure_ascii=True, allow_nan=False)
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def loads(raw: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+# Directories already created by this process; avoids a mkdir per write.
+_parent_ready: set[Path] = set()
+
+
+def _open_tmp(path: Path, tmp: str) -> int:
+    parent = path.parent
+    if parent not in _parent_ready:
+        parent.mkdir(parents=True, exist_ok=True)
+        _parent_ready.add(parent)
+    try:
+        return os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    except FileNotFoundError:
+        # The directory was removed since it was cached; recreate it once.
+        _parent_ready.discard(parent)
+        parent.mkdir(parents=True, exist_ok=True)
+        _parent_ready.add(parent)
+        return os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+
+def write_bytes_atomic(path: Path, data: bytes, *, durable: bool = False) -> None:
+    tmp = f"{path}.tmp"
+    fd = _open_tmp(path, tmp)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if durable:
+            _fdatasync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import ctypes
 from datetime import datetime, timezone
-import json
+import os
 from pathlib import Path
+import select
+import struct
+import sys
 import time
 from typing import Any
 
 from .config import AppConfig
+from .jsonio import dumps_bytes, write_bytes_atomic
 from .memory_backend import SaveDataProvider
 
 
@@ -14,20 +19,27 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
-    tmp.replace(path)
+def _write_json_atomic(path: Path, payload: dict[str, Any], *, durable: bool = False) -> None:
+    write_bytes_atomic(path, dumps_bytes(payload, indent=True), durable=durable)
 
 
-def generate_signal_once(
+# Fields that change on every tick even when the save data itself has not.
+_VOLATILE_SIGNAL_KEYS = ("generated_at", "save_data_age_seconds")
+
+
+def _signal_fingerprint(payload: dict[str, Any]) -> bytes:
+    return dumps_bytes({k: v for k, v in payload.items() if k not in _VOLATILE_SIGNAL_KEYS})
+
+
+def _build_signal(
     cfg: AppConfig,
     *,
     save_path_override: str = "",
     output_override: str = "",
+    provider: SaveDataProvider | None = None,
 ) -> dict[str, Any]:
-    provider = SaveDataProvider(cfg, save_path_override=save_path_override)
+    if provider is None:
+        provider = SaveDataProvider(cfg, save_path_override=save_path_override)
     result = provider.probe()
     out_path = cfg.resolve(output_override or cfg.live.memory_signal_file)
 
@@ -38,7 +50,6 @@ def generate_signal_once(
             "reason": result.reason,
             "source": provider.name,
         }
-        _write_json_atomic(out_path, payload)
         return {
             "ok": False,
             "reason": result.reason,
@@ -63,21 +74,22 @@ def generate_signal_once(
         "steam_achievements": signal.steam_achievements,
         "steam_achievements_target": signal.steam_achievements_target,
         "steam_achievements_ratio": signal.steam_achievements_ratio,
-        "unlocked_characters": signal.unlocked_characters,
         "unlocked_characters_count": signal.unlocked_characters_count,
-        "unlocked_arcanas": signal.unlocked_arcanas,
         "unlocked_arcanas_count": signal.unlocked_arcanas_count,
-        "unlocked_weapons": signal.unlocked_weapons,
         "unlocked_weapons_count": signal.unlocked_weapons_count,
-        "unlocked_passives": signal.unlocked_passives,
         "unlocked_passives_count": signal.unlocked_passives_count,
-        "unlocked_stages": signal.unlocked_stages,
         "unlocked_stages_count": signal.unlocked_stages_count,
         "save_data_age_seconds": signal.save_data_age_seconds,
         "save_data_stale": signal.save_data_stale,
         "save_data_path": signal.save_data_path,
     }
-    _write_json_atomic(out_path, payload)
+    # Unlock-token objectives read these lists; counts-only consumers can drop them.
+    if cfg.live.include_unlock_lists:
+        payload["unlocked_characters"] = signal.unlocked_characters
+        payload["unlocked_arcanas"] = signal.unlocked_arcanas
+        payload["unlocked_weapons"] = signal.unlocked_weapons
+        payload["unlocked_passives"] = signal.unlocked_passives
+        payload["unlocked_stages"] = signal.unlocked_stages
     return {
         "ok": True,
         "reason": "ok",
@@ -86,6 +98,91 @@ def generate_signal_once(
     }
 
 
+def generate_signal_once(
+    cfg: AppConfig,
+    *,
+    save_path_override: str = "",
+    output_override: str = "",
+    provider: SaveDataProvider | None = None,
+) -> dict[str, Any]:
+    out = _build_signal(
+        cfg,
+        save_path_override=save_path_override,
+        output_override=output_override,
+        provider=provider,
+    )
+    _write_json_atomic(Path(out["output"]), out["payload"])
+    return out
+
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class _SaveFileWatcher:
+    """Wakes on writes to one file via inotify on Linux; plain sleep elsewhere."""
+
+    def __init__(self, path: Path | None) -> None:
+        self._fd = -1
+        self._name = os.fsencode(path.name) if path is not None else b""
+        if path is None or not sys.platform.startswith("linux"):
+            return
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return
+            # Watch the directory: saves are often replaced by rename, which
+            # would drop a watch placed on the file itself.
+            if libc.inotify_add_watch(fd, os.fsencode(path.parent), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+                os.close(fd)
+                return
+        except (OSError, AttributeError):
+            return
+        self._fd = fd
+
+    @property
+    def active(self) -> bool:
+        return self._fd >= 0
+
+    def wait(self, timeout_s: float) -> bool:
+        """Sleep up to timeout_s; True when the watched file was written."""
+        if self._fd < 0:
+            time.sleep(timeout_s)
+            return False
+        deadline = time.monotonic() + timeout_s
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0.0:
+                return False
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if ready and self._drain():
+                return True
+
+    def _drain(self) -> bool:
+        hit = False
+        while True:
+            try:
+                buf = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return hit
+            if not buf:
+                return hit
+            offset = 0
+            while offset + _INOTIFY_EVENT.size <= len(buf):
+                _, _, _, name_len = _INOTIFY_EVENT.unpack_from(buf, offset)
+                start = offset + _INOTIFY_EVENT.size
+                if buf[start : start + name_len].rstrip(b"\0") == self._name:
+                    hit = True
+                offset = start + name_len
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
 def run_signal_daemon(
     cfg: AppConfig,
     *,
@@ -94,10 +191,33 @@ def run_signal_daemon(
     interval_s: float = 2.0,
 ) -> None:
     wait = max(0.2, float(interval_s))
-    while True:
-        _ = generate_signal_once(
-            cfg,
-            save_path_override=save_path_override,
-            output_override=output_override,
-        )
-        time.sleep(wait)
+    # One provider for the daemon lifetime so its parsed-save cache carries over.
+    provider = SaveDataProvider(cfg, save_path_override=save_path_override)
+    # Unchanged signals are rewritten only often enough to stay well inside the
+    # consumer's max-age window, so readers never see a stale file.
+    refresh_s = max(wait, float(cfg.live.memory_signal_max_age_seconds) / 2.0)
+    # With a save-file watch the loop only needs to wake for refreshes; game
+    # saves interrupt the wait immediately.
+    watcher = _SaveFileWatcher(provider.resolve_path())
+    idle_wait = refresh_s if watcher.active else wait
+    last_fingerprint: bytes | None = None
+    last_write_mono = 0.0
+    try:
+        while True:
+            out = _build_signal(
+                cfg,
+                save_path_override=save_path_override,
+                output_override=output_override,
+                provider=provider,
+            )
+            fingerprint = _signal_fingerprint(out["payload"])
+            now_mono = time.monotonic()
+            changed = fingerprint != last_fingerprint
+            if changed or (now_mono - last_write_mono) >= refresh_s:
+                # Only real signal changes are worth an fsync; refreshes are not.
+                _write_json_atomic(Path(out["output"]), out["payload"], durable=changed)
+                last_fingerprint = fingerprint
+                last_write_mono = now_mono
+            watcher.wait(idle_wait)
+    finally:
+        watcher.close()
@@ -1,21 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
-import json
+from dataclasses import dataclass, replace
+import itertools
 import os
 from pathlib import Path
+import time
 from typing import Any, Protocol
 
 from .config import AppConfig
+from .jsonio import loads as json_loads
 
 
 def _clamp01(value: float) -> float:
     return min(1.0, max(0.0, float(value)))
 
 
+_TRUTHY = frozenset({"1", "true", "yes", "ready", "on"})
+
+
 def _is_truthy(raw: str) -> bool:
-    return str(raw or "").strip().lower() in {"1", "true", "yes", "ready", "on"}
+    return bool(raw) and raw.strip().lower() in _TRUTHY
 
 
 COLLECTION_TARGET_ENTRIES = 470
@@ -23,7 +27,7 @@ BESTIARY_TARGET_ENTRIES = 360
 STEAM_ACHIEVEMENTS_TARGET = 243
 
 # Known passive item IDs used by SaveData payloads.
-PASSIVE_ITEM_IDS = {
+PASSIVE_ITEM_IDS = frozenset({
     "POWER",
     "ARMOR",
     "MAXHP",
@@ -56,17 +60,19 @@ PASSIVE_ITEM_IDS = {
     "CROWN",
     "STONE_MASK",
     "SKULL_O_MANIAC",
-}
+})
 
 
 def _as_str_set(raw: object) -> set[str]:
     if not isinstance(raw, list):
         return set()
     out: set[str] = set()
+    add = out.add
     for item in raw:
-        value = str(item).strip()
+        # JSON unlock lists are strings already; only other scalars need str().
+        value = item.strip() if isinstance(item, str) else str(item).strip()
         if value:
-            out.add(value)
+            add(value)
     return out
 
 
@@ -75,7 +81,7 @@ def _optional_str_list(raw: object) -> list[str] | None:
         return None
     if not isinstance(raw, list):
         return None
-    return [str(x) for x in raw]
+    return [x if isinstance(x, str) else str(x) for x in raw]
 
 
 def _count_positive_values(raw: object) -> int:
@@ -83,17 +89,25 @@ def _count_positive_values(raw: object) -> int:
         return 0
     count = 0
     for value in raw.values():
-        try:
-            if float(value) > 0.0:
+        # Save data stores kill counts as JSON numbers; only numeric strings need
+        # float() parsing, and anything else (null, lists, objects) never counts.
+        if isinstance(value, (int, float)):
+            if value > 0:
                 count += 1
-        except Exception:  # noqa: BLE001
-            continue
+        elif isinstance(value, str):
+            try:
+                if float(value) > 0.0:
+                    count += 1
+            except ValueError:
+                continue
     return count
 
 
 def _optional_int(raw: object) -> int | None:
     if raw is None:
         return None
+    if type(raw) is int:
+        return raw
     try:
         return int(raw)
     except Exception:  # noqa: BLE001
@@ -103,6 +117,8 @@ def _optional_int(raw: object) -> int | None:
 def _optional_ratio(raw: object) -> float | None:
     if raw is None:
         return None
+    if type(raw) is float:
+        return raw if 0.0 <= raw <= 1.0 else _clamp01(raw)
     try:
         return _clamp01(float(raw))
     except Exception:  # noqa: BLE001
@@ -112,13 +128,23 @@ def _optional_ratio(raw: object) -> float | None:
 def _optional_float(raw: object) -> float | None:
     if raw is None:
         return None
+    if type(raw) is float:
+        return raw
     try:
         return float(raw)
     except Exception:  # noqa: BLE001
         return None
 
 
-@dataclass(frozen=True)
+def _optional_bool(raw: object) -> bool | None:
+    return bool(raw) if raw is not None else None
+
+
+def _optional_stripped_str(raw: object) -> str | None:
+    return str(raw).strip() if raw is not None else None
+
+
+@dataclass(frozen=True, slots=True)
 class MemorySignal:
     objective_hint: float
     stability_hint: float
@@ -148,7 +174,7 @@ class MemorySignal:
     save_data_path: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryProbeResult:
     ok: bool
     reason: str
@@ -161,24 +187,62 @@ class SignalProvider(Protocol):
     def probe(self) -> MemoryProbeResult: ...
 
 
+# Optional MemorySignal fields read from the signal file, with their decoders.
+_SIGNAL_FILE_FIELDS = (
+    ("collection_entries", _optional_int),
+    ("collection_target", _optional_int),
+    ("collection_ratio", _optional_ratio),
+    ("bestiary_entries", _optional_int),
+    ("bestiary_target", _optional_int),
+    ("bestiary_ratio", _optional_ratio),
+    ("steam_achievements", _optional_int),
+    ("steam_achievements_target", _optional_int),
+    ("steam_achievements_ratio", _optional_ratio),
+    ("unlocked_characters", _optional_str_list),
+    ("unlocked_characters_count", _optional_int),
+    ("unlocked_arcanas", _optional_str_list),
+    ("unlocked_arcanas_count", _optional_int),
+    ("unlocked_weapons", _optional_str_list),
+    ("unlocked_weapons_count", _optional_int),
+    ("unlocked_passives", _optional_str_list),
+    ("unlocked_passives_count", _optional_int),
+    ("unlocked_stages", _optional_str_list),
+    ("unlocked_stages_count", _optional_int),
+    ("save_data_age_seconds", _optional_float),
+    ("save_data_stale", _optional_bool),
+    ("save_data_path", _optional_stripped_str),
+)
+
+
 class SignalFileProvider:
     name = "signal_file"
 
     def __init__(self, cfg: AppConfig) -> None:
         self.cfg = cfg
+        self._cache: tuple[tuple[str, int, int], MemoryProbeResult] | None = None
 
     def probe(self) -> MemoryProbeResult:
         path = self.cfg.resolve(self.cfg.live.memory_signal_file)
-        if not path.exists():
+        try:
+            stat = os.stat(path)
+        except OSError:
             return MemoryProbeResult(ok=False, reason=f"missing:{path}", signal=None)
 
         max_age = max(1.0, float(self.cfg.live.memory_signal_max_age_seconds))
-        age_s = max(0.0, datetime.now(timezone.utc).timestamp() - path.stat().st_mtime)
+        age_s = max(0.0, time.time() - stat.st_mtime)
         if age_s > max_age:
             return MemoryProbeResult(ok=False, reason=f"stale:{age_s:.2f}s", signal=None)
 
+        cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[0] == cache_key:
+            return self._cache[1]
+        result = self._probe_payload(path)
+        self._cache = (cache_key, result)
+        return result
+
+    def _probe_payload(self, path: Path) -> MemoryProbeResult:
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = json_loads(path.read_bytes())
         except Exception as exc:  # noqa: BLE001
             return MemoryProbeResult(ok=False, reason=f"json_decode_error:{exc}", signal=None)
 
@@ -197,28 +261,7 @@ class SignalFileProvider:
             stability_hint=_clamp01(float(stability_hint)),
             confidence=_clamp01(float(confidence)),
             source=f"signal_file:{path}",
-            collection_entries=_optional_int(payload.get("collection_entries")),
-            collection_target=_optional_int(payload.get("collection_target")),
-            collection_ratio=_optional_ratio(payload.get("collection_ratio")),
-            bestiary_entries=_optional_int(payload.get("bestiary_entries")),
-            bestiary_target=_optional_int(payload.get("bestiary_target")),
-            bestiary_ratio=_optional_ratio(payload.get("bestiary_ratio")),
-            steam_achievements=_optional_int(payload.get("steam_achievements")),
-            steam_achievements_target=_optional_int(payload.get("steam_achievements_target")),
-            steam_achievements_ratio=_optional_ratio(payload.get("steam_achievements_ratio")),
-            unlocked_characters=_optional_str_list(payload.get("unlocked_characters")),
-            unlocked_characters_count=_optional_int(payload.get("unlocked_characters_count")),
-            unlocked_arcanas=_optional_str_list(payload.get("unlocked_arcanas")),
-            unlocked_arcanas_count=_optional_int(payload.get("unlocked_arcanas_count")),
-            unlocked_weapons=_optional_str_list(payload.get("unlocked_weapons")),
-            unlocked_weapons_count=_optional_int(payload.get("unlocked_weapons_count")),
-            unlocked_passives=_optional_str_list(payload.get("unlocked_passives")),
-            unlocked_passives_count=_optional_int(payload.get("unlocked_passives_count")),
-            unlocked_stages=_optional_str_list(payload.get("unlocked_stages")),
-            unlocked_stages_count=_optional_int(payload.get("unlocked_stages_count")),
-            save_data_age_seconds=_optional_float(payload.get("save_data_age_seconds")),
-            save_data_stale=(bool(payload.get("save_data_stale")) if payload.get("save_data_stale") is not None else None),
-            save_data_path=(str(payload.get("save_data_path")).strip() if payload.get("save_data_path") is not None else None),
+            **{field: convert(payload.get(field)) for field, convert in _SIGNAL_FILE_FIELDS},
         )
         return MemoryProbeResult(ok=True, reason="ok", signal=signal)
 
@@ -229,20 +272,29 @@ class SaveDataProvider:
     def __init__(self, cfg: AppConfig, *, save_path_override: str = "") -> None:
         self.cfg = cfg
         self.save_path_override = str(save_path_override or "").strip()
+        self._cache: tuple[tuple[str, int, int], MemorySignal] | None = None
+        self._sorted_cache: dict[str, tuple[frozenset[str], list[str]]] = {}
 
-    def probe(self) -> MemoryProbeResult:
+    def resolve_path(self) -> Path | None:
         override = self.save_path_override
         configured = str(self.cfg.live.save_data_path or "").strip()
         env_override = os.environ.get("VSBOT_SAVE_DATA_PATH", "").strip()
         raw = override or env_override or configured
         if not raw:
+            return None
+        return self.cfg.resolve(raw)
+
+    def probe(self) -> MemoryProbeResult:
+        path = self.resolve_path()
+        if path is None:
             return MemoryProbeResult(ok=False, reason="save_data_path_unset", signal=None)
 
-        path = self.cfg.resolve(raw)
-        if not path.exists():
+        try:
+            stat = os.stat(path)
+        except OSError:
             return MemoryProbeResult(ok=False, reason=f"missing:{path}", signal=None)
 
-        age_s = max(0.0, datetime.now(timezone.utc).timestamp() - path.stat().st_mtime)
+        age_s = max(0.0, time.time() - stat.st_mtime)
         stale_minutes = max(0.0, float(self.cfg.live.save_data_stale_minutes))
         stale_threshold_s = stale_minutes * 60.0
         if stale_threshold_s > 0.0 and age_s > stale_threshold_s:
@@ -252,8 +304,14 @@ class SaveDataProvider:
                 signal=None,
             )
 
+        # Save files only change on game writes; reuse the parsed signal until then.
+        cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[0] == cache_key:
+            signal = replace(self._cache[1], save_data_age_seconds=age_s)
+            return MemoryProbeResult(ok=True, reason="ok", signal=signal)
+
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = json_loads(path.read_bytes())
         except Exception as exc:  # noqa: BLE001
             return MemoryProbeResult(ok=False, reason=f"json_decode_error:{exc}", signal=None)
 
@@ -266,7 +324,9 @@ class SaveDataProvider:
             save_data_age_seconds=age_s,
             save_data_path=str(path),
             save_data_stale=False,
+            sorted_cache=self._sorted_cache,
         )
+        self._cache = (cache_key, signal)
         return MemoryProbeResult(ok=True, reason="ok", signal=signal)
 
 
@@ -293,6 +353,8 @@ class EnvGateProvider:
 class MemoryBackend:
     def __init__(self, cfg: AppConfig) -> None:
         self.cfg = cfg
+        # Built once so provider-level parse caches survive across probes.
+        self._provider_list = self._providers()
 
     def _providers(self) -> list[SignalProvider]:
         mode = str(self.cfg.live.memory_backend or "auto").strip().lower()
@@ -318,7 +380,7 @@ class MemoryBackend:
             return MemoryProbeResult(ok=False, reason="live_disabled_by_config", signal=None)
 
         reasons: list[str] = []
-        for provider in self._providers():
+        for provider in self._provider_list:
             result = provider.probe()
             if result.ok:
                 return result
@@ -330,6 +392,23 @@ class MemoryBackend:
         return MemoryProbeResult(ok=False, reason=reason, signal=None)
 
 
+# Unlock lists rarely change between save writes; reuse the previous sorted list
+# when the token set is unchanged instead of re-sorting it.
+def _sorted_tokens(
+    key: str,
+    tokens: set[str],
+    cache: dict[str, tuple[frozenset[str], list[str]]] | None,
+) -> list[str]:
+    if cache is None:
+        return sorted(tokens)
+    hit = cache.get(key)
+    if hit is not None and hit[0] == tokens:
+        return hit[1]
+    ordered = sorted(tokens)
+    cache[key] = (frozenset(tokens), ordered)
+    return ordered
+
+
 def signal_from_save_payload(
     payload: dict[str, object],
     *,
@@ -337,41 +416,59 @@ def signal_from_save_payload(
     save_data_age_seconds: float | None = None,
     save_data_path: str | None = None,
     save_data_stale: bool | None = None,
+    sorted_cache: dict[str, tuple[frozenset[str], list[str]]] | None = None,
 ) -> MemorySignal:
-    unlocked_characters = sorted(_as_str_set(payload.get("UnlockedCharacters", [])))
-    unlocked_arcanas = sorted(_as_str_set(payload.get("UnlockedArcanas", [])))
+    unlocked_characters = _sorted_tokens("characters", _as_str_set(payload.get("UnlockedCharacters", [])), sorted_cache)
+    unlocked_arcanas_set = _as_str_set(payload.get("UnlockedArcanas", []))
+    unlocked_arcanas = _sorted_tokens("arcanas", unlocked_arcanas_set, sorted_cache)
     unlocked_weapons_raw = _as_str_set(payload.get("UnlockedWeapons", []))
-    unlocked_stages = sorted(_as_str_set(payload.get("UnlockedStages", [])))
+    unlocked_stages = _sorted_tokens("stages", _as_str_set(payload.get("UnlockedStages", [])), sorted_cache)
     collected_weapons = _as_str_set(payload.get("CollectedWeapons", []))
     collected_items = _as_str_set(payload.get("CollectedItems", []))
     unlocked_relics = _as_str_set(payload.get("UnlockedRelics", []))
     achievements = _as_str_set(payload.get("Achievements", []))
 
-    unlocked_passives_set = {
-        token
-        for token in (unlocked_weapons_raw | collected_weapons | collected_items)
-        if str(token).strip().upper() in PASSIVE_ITEM_IDS
+    # _as_str_set already yields stripped strings, so only case needs normalising,
+    # and each distinct token is upper-cased once for both filters.
+    is_passive = {
+        token: token.upper() in PASSIVE_ITEM_IDS
+        for token in itertools.chain(unlocked_weapons_raw, collected_weapons, collected_items)
     }
-    unlocked_passives = sorted(unlocked_passives_set)
-    unlocked_weapons = sorted(
-        token for token in unlocked_weapons_raw if str(token).strip().upper() not in PASSIVE_ITEM_IDS
+    unlocked_passives = _sorted_tokens(
+        "passives", {token for token, passive in is_passive.items() if passive}, sorted_cache
+    )
+    unlocked_weapons = _sorted_tokens(
+        "weapons", {token for token in unlocked_weapons_raw if not is_passive[token]}, sorted_cache
     )
 
-    collection_entries = len(collected_weapons | collected_items | set(unlocked_arcanas) | unlocked_relics)
+    collection = set(collected_weapons)
+    collection.update(collected_items, unlocked_arcanas_set, unlocked_relics)
+    collection_entries = len(collection)
     bestiary_entries = _count_positive_values(payload.get("KillCount", {}))
     steam_achievements = len(achievements)
 
-    collection_ratio = _clamp01(collection_entries / float(COLLECTION_TARGET_ENTRIES))
-    bestiary_ratio = _clamp01(bestiary_entries / float(BESTIARY_TARGET_ENTRIES))
-    steam_achievements_ratio = _clamp01(steam_achievements / float(STEAM_ACHIEVEMENTS_TARGET))
+    # Counts are non-negative and true division already yields floats, so each
+    # ratio only needs its upper bound clamped.
+    collection_ratio = collection_entries / COLLECTION_TARGET_ENTRIES
+    if collection_ratio > 1.0:
+        collection_ratio = 1.0
+    bestiary_ratio = bestiary_entries / BESTIARY_TARGET_ENTRIES
+    if bestiary_ratio > 1.0:
+        bestiary_ratio = 1.0
+    steam_achievements_ratio = steam_achievements / STEAM_ACHIEVEMENTS_TARGET
+    if steam_achievements_ratio > 1.0:
+        steam_achievements_ratio = 1.0
 
     # Blend long-horizon account completion dimensions into one stable quality hint.
-    objective_hint = _clamp01(
+    # The weights sum to 1.0, so only float rounding can push it past the bound.
+    objective_hint = (
         (0.45 * collection_ratio)
         + (0.30 * bestiary_ratio)
         + (0.25 * steam_achievements_ratio)
     )
-    stability_hint = _clamp01(0.35 + (objective_hint * 0.5))
+    if objective_hint > 1.0:
+        objective_hint = 1.0
+    stability_hint = 0.35 + (objective_hint * 0.5)
     confidence = 0.75
 
     return MemorySignal(
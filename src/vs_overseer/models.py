@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
@@ -9,7 +9,7 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PolicyParameters:
     aggression: float
     greed: float
@@ -42,7 +42,7 @@ class PolicyParameters:
         ).clamp()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimEpisodeResult:
     unlock_rate: float
     objective_complete: bool
@@ -50,10 +50,15 @@ class SimEpisodeResult:
     elapsed_s: float
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "unlock_rate": self.unlock_rate,
+            "objective_complete": self.objective_complete,
+            "stability": self.stability,
+            "elapsed_s": self.elapsed_s,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimBatchMetrics:
     episodes: int
     objective_rate: float
@@ -62,10 +67,16 @@ class SimBatchMetrics:
     mean_elapsed_s: float
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "episodes": self.episodes,
+            "objective_rate": self.objective_rate,
+            "unlock_rate": self.unlock_rate,
+            "stability_rate": self.stability_rate,
+            "mean_elapsed_s": self.mean_elapsed_s,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LiveBatchMetrics:
     runs: int
     objective_rate: float
@@ -74,10 +85,16 @@ class LiveBatchMetrics:
     reason: str
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "runs": self.runs,
+            "objective_rate": self.objective_rate,
+            "stability_rate": self.stability_rate,
+            "blocked": self.blocked,
+            "reason": self.reason,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CanaryDecision:
     promote: bool
     reason: str
@@ -86,4 +103,10 @@ class CanaryDecision:
     live_deferred: bool
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "promote": self.promote,
+            "reason": self.reason,
+            "improvement": self.improvement,
+            "stability_regression": self.stability_regression,
+            "live_deferred": self.live_deferred,
+        }
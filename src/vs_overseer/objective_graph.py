@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import heapq
 import json
 from pathlib import Path
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Objective:
     id: str
     name: str
@@ -15,6 +16,11 @@ class Objective:
     unlock_signal: str
     weight: float
     estimated_time_s: int
+    # (kind, value) split from unlock_signal once, so unlock checks skip the string work.
+    parsed_unlock: tuple[str, str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "parsed_unlock", parse_unlock_signal(self.unlock_signal))
 
     @staticmethod
     def from_dict(payload: dict[str, Any]) -> "Objective":
@@ -29,12 +35,22 @@ class Objective:
         )
 
 
+def parse_unlock_signal(unlock_signal: str) -> tuple[str, str] | None:
+    raw = str(unlock_signal or "").strip()
+    if not raw or ":" not in raw:
+        return None
+    kind, value = raw.split(":", 1)
+    return kind.strip().lower(), value.strip().lower()
+
+
 class ObjectiveGraph:
     def __init__(self, objectives: list[Objective]) -> None:
         self.objectives = objectives
         self.by_id = {o.id: o for o in objectives}
         if len(self.by_id) != len(objectives):
             raise ValueError("duplicate objective id detected")
+        self._topo: list[Objective] | None = None
+        self._prereq_sets: dict[str, frozenset[str]] = {o.id: frozenset(o.prerequisites) for o in objectives}
 
     @staticmethod
     def load(path: str | Path) -> "ObjectiveGraph":
@@ -55,6 +71,12 @@ class ObjectiveGraph:
         _ = self.topological_order()
 
     def topological_order(self) -> list[Objective]:
+        # The graph is immutable after construction, so the order is computed once.
+        if self._topo is None:
+            self._topo = self._compute_topological_order()
+        return list(self._topo)
+
+    def _compute_topological_order(self) -> list[Objective]:
         indegree = {o.id: 0 for o in self.objectives}
         children: dict[str, list[str]] = {o.id: [] for o in self.objectives}
         for obj in self.objectives:
@@ -63,26 +85,28 @@ class ObjectiveGraph:
                 children[dep].append(obj.id)
 
         queue = [oid for oid, deg in indegree.items() if deg == 0]
-        queue.sort()
+        heapq.heapify(queue)
         ordered_ids: list[str] = []
 
         while queue:
-            current = queue.pop(0)
+            current = heapq.heappop(queue)
             ordered_ids.append(current)
             for child in children[current]:
                 indegree[child] -= 1
                 if indegree[child] == 0:
-                    queue.append(child)
-            queue.sort()
+                    heapq.heappush(queue, child)
 
         if len(ordered_ids) != len(self.objectives):
             raise ValueError("objective graph contains a cycle")
         return [self.by_id[x] for x in ordered_ids]
 
-    def next_objective(self, completed: set[str]) -> Objective | None:
-        for obj in self.topological_order():
+    def next_objective(self, completed: set[str] | frozenset[str]) -> Objective | None:
+        if self._topo is None:
+            self._topo = self._compute_topological_order()
+        prereq_sets = self._prereq_sets
+        for obj in self._topo:
             if obj.id in completed:
                 continue
-            if all(dep in completed for dep in obj.prerequisites):
+            if prereq_sets[obj.id] <= completed:
                 return obj
         return None
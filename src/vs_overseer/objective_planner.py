@@ -1,44 +1,60 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-import json
+import bisect
+from dataclasses import dataclass, field
+import heapq
+import os
 from pathlib import Path
-from typing import Any
+import re
+import sys
+from typing import Any, Iterable
 
+from .jsonio import loads as json_loads
 from .objective_graph import Objective
 
 
 def _to_float(raw: object) -> float | None:
+    # Signal metrics are almost always JSON numbers already.
+    if type(raw) is float:
+        return raw
+    if type(raw) is int:
+        return float(raw)
+    if raw is None:
+        return None
     try:
-        if raw is None:
-            return None
         return float(raw)
     except Exception:  # noqa: BLE001
         return None
 
 
 def _format_target(value: float) -> str:
-    if abs(value - round(value)) < 1e-9:
-        return str(int(round(value)))
+    rounded = round(value)
+    if value == rounded:
+        return str(rounded)
+    # Near-integers still collapse to the integer text via the trimmed 4dp form.
     return f"{value:.4f}".rstrip("0").rstrip(".")
 
 
+class _SanitizeTable(dict[int, int]):
+    # str.translate table that fills itself: alphanumerics map to themselves,
+    # everything else to "_".
+    def __missing__(self, codepoint: int) -> int:
+        mapped = codepoint if chr(codepoint).isalnum() else ord("_")
+        self[codepoint] = mapped
+        return mapped
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+_UNDERSCORE_RUN_RE = re.compile(r"_{2,}")
+
+
 def _sanitize_token(raw: str) -> str:
-    out = []
-    for ch in str(raw).strip().lower():
-        if ch.isalnum():
-            out.append(ch)
-        elif ch in {".", "-"}:
-            out.append("_")
-        else:
-            out.append("_")
-    compact = "".join(out).strip("_")
-    while "__" in compact:
-        compact = compact.replace("__", "_")
+    compact = str(raw).strip().lower().translate(_SANITIZE_TABLE)
+    compact = _UNDERSCORE_RUN_RE.sub("_", compact).strip("_")
     return compact or "goal"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlannerTemplate:
     id_prefix: str
     name_template: str
@@ -49,6 +65,27 @@ class PlannerTemplate:
     weight: float
     estimated_time_s: int
     priority: int
+    # One Objective per entry in targets; fully determined by the template, so
+    # plan() hands out the same instances instead of rebuilding them.
+    _objectives: tuple[Objective, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        prefix = _sanitize_token(self.id_prefix)
+        objectives = []
+        for target in self.targets:
+            target_text = _format_target(target)
+            objectives.append(
+                Objective(
+                    id=f"{prefix}_{_sanitize_token(target_text)}",
+                    name=self.name_template.format(target=target_text),
+                    category=self.category,
+                    prerequisites=tuple(),
+                    unlock_signal=f"{self.signal_key}:{target_text}",
+                    weight=self.weight,
+                    estimated_time_s=self.estimated_time_s,
+                )
+            )
+        object.__setattr__(self, "_objectives", tuple(objectives))
 
     @staticmethod
     def from_dict(payload: dict[str, Any]) -> "PlannerTemplate":
@@ -64,7 +101,8 @@ class PlannerTemplate:
             id_prefix=str(payload.get("id_prefix", "")).strip() or "wiki_goal",
             name_template=str(payload.get("name_template", "Wiki Route: Reach {target}")).strip(),
             category=str(payload.get("category", "wiki")).strip() or "wiki",
-            signal_key=str(payload.get("signal_key", "")).strip(),
+            # Interned so payload lookups can match on identity before comparing text.
+            signal_key=sys.intern(str(payload.get("signal_key", "")).strip()),
             targets=tuple(targets),
             max_gap=max(0.0, float(payload.get("max_gap", 0.0))),
             weight=float(payload.get("weight", 1.0)),
@@ -78,44 +116,48 @@ class PlannerTemplate:
         if not self.targets:
             raise ValueError(f"planner template '{self.id_prefix}' missing targets")
 
-    def candidate(self, *, signal_payload: dict[str, Any], completed_ids: set[str]) -> "PlannedObjective" | None:
+    def candidate(
+        self,
+        *,
+        signal_payload: dict[str, Any],
+        completed_ids: set[str] | frozenset[str],
+    ) -> "PlannedObjective" | None:
         current = _to_float(signal_payload.get(self.signal_key))
         if current is None:
             return None
+        return self.candidate_at(current, completed_ids=completed_ids)
 
-        for target in self.targets:
-            if current >= target:
-                continue
-            gap = float(target - current)
-            if gap > self.max_gap:
-                continue
-
-            target_text = _format_target(target)
-            objective_id = f"{_sanitize_token(self.id_prefix)}_{_sanitize_token(target_text)}"
-            if objective_id in completed_ids:
+    def candidate_at(
+        self,
+        current: float,
+        *,
+        completed_ids: set[str] | frozenset[str],
+    ) -> "PlannedObjective" | None:
+        # Targets are sorted: skip the reached ones by bisection, and stop at the
+        # first target beyond max_gap since every later gap is larger.
+        targets = self.targets
+        objectives = self._objectives
+        max_gap = self.max_gap
+        for index in range(bisect.bisect_right(targets, current), len(targets)):
+            target = targets[index]
+            if target - current > max_gap:
+                break
+            objective = objectives[index]
+            if objective.id in completed_ids:
                 continue
-
-            objective = Objective(
-                id=objective_id,
-                name=self.name_template.format(target=target_text),
-                category=self.category,
-                prerequisites=tuple(),
-                unlock_signal=f"{self.signal_key}:{target_text}",
-                weight=float(self.weight),
-                estimated_time_s=int(self.estimated_time_s),
-            )
+            gap = target - current
             return PlannedObjective(
                 objective=objective,
-                priority=int(self.priority),
+                priority=self.priority,
                 metric=self.signal_key,
-                current=float(current),
-                target=float(target),
-                gap=float(gap),
+                current=current,
+                target=target,
+                gap=gap,
             )
         return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlannedObjective:
     objective: Objective
     priority: int
@@ -125,19 +167,23 @@ class PlannedObjective:
     gap: float
 
     def to_dict(self) -> dict[str, Any]:
+        # Fields are already coerced on construction; planned objectives never
+        # carry prerequisites, so skip the list copy in that case.
+        objective = self.objective
+        prerequisites = objective.prerequisites
         return {
-            "id": self.objective.id,
-            "name": self.objective.name,
-            "category": self.objective.category,
-            "prerequisites": list(self.objective.prerequisites),
-            "unlock_signal": self.objective.unlock_signal,
-            "weight": float(self.objective.weight),
-            "estimated_time_s": int(self.objective.estimated_time_s),
-            "priority": int(self.priority),
+            "id": objective.id,
+            "name": objective.name,
+            "category": objective.category,
+            "prerequisites": list(prerequisites) if prerequisites else [],
+            "unlock_signal": objective.unlock_signal,
+            "weight": objective.weight,
+            "estimated_time_s": objective.estimated_time_s,
+            "priority": self.priority,
             "metric": self.metric,
-            "current": float(self.current),
-            "target": float(self.target),
-            "gap": float(self.gap),
+            "current": self.current,
+            "target": self.target,
+            "gap": self.gap,
         }
 
     @staticmethod
@@ -161,6 +207,10 @@ class PlannedObjective:
         )
 
 
+# Last planner built per (mapping path, window size), with the file's (mtime_ns, size).
+_LOAD_CACHE: dict[tuple[Path, int], tuple[tuple[int, int], ObjectivePlanner]] = {}
+
+
 class ObjectivePlanner:
     def __init__(
         self,
@@ -172,28 +222,57 @@ class ObjectivePlanner:
         self.mapping_path = mapping_path
         self.templates = templates
         self.rolling_window_size = max(1, int(rolling_window_size))
+        # Templates sharing a metric read and parse it once per plan().
+        self._by_signal: dict[str, list[PlannerTemplate]] = {}
+        for template in templates:
+            self._by_signal.setdefault(template.signal_key, []).append(template)
 
     @staticmethod
     def load(path: str | Path, *, rolling_window_size: int) -> "ObjectivePlanner":
         mapping_path = Path(path).expanduser().resolve()
-        payload = json.loads(mapping_path.read_text(encoding="utf-8"))
+        # Planners are read-only after construction, so an unchanged mapping file
+        # can hand back the instance built last time.
+        stat = os.stat(mapping_path)
+        cache_key = (mapping_path, int(rolling_window_size))
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = _LOAD_CACHE.get(cache_key)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        payload = json_loads(mapping_path.read_bytes())
         rows = payload.get("templates", []) if isinstance(payload, dict) else []
         templates = [PlannerTemplate.from_dict(row) for row in rows if isinstance(row, dict)]
         for template in templates:
             template.validate()
-        return ObjectivePlanner(
+        planner = ObjectivePlanner(
             mapping_path=mapping_path,
             templates=templates,
             rolling_window_size=rolling_window_size,
         )
+        _LOAD_CACHE[cache_key] = (file_key, planner)
+        return planner
 
-    def plan(self, *, signal_payload: dict[str, Any], completed_ids: set[str]) -> list[PlannedObjective]:
+    def plan(self, *, signal_payload: dict[str, Any], completed_ids: Iterable[str]) -> list[PlannedObjective]:
+        # Hash the ids once up front; str objects cache their hash, so the
+        # per-target membership checks below stay O(1) without extra memoising.
+        if not isinstance(completed_ids, (set, frozenset)):
+            completed_ids = frozenset(completed_ids)
         out: list[PlannedObjective] = []
-        for template in self.templates:
-            candidate = template.candidate(signal_payload=signal_payload, completed_ids=completed_ids)
-            if candidate is None:
+        for signal_key, templates in self._by_signal.items():
+            current = _to_float(signal_payload.get(signal_key))
+            if current is None:
                 continue
-            out.append(candidate)
+            for template in templates:
+                candidate = template.candidate_at(current, completed_ids=completed_ids)
+                if candidate is None:
+                    continue
+                out.append(candidate)
+
+        # The window is usually much smaller than the candidate list; select the
+        # top-k directly instead of sorting everything.
+        return heapq.nsmallest(
+            self.rolling_window_size,
+            out,
+            key=lambda item: (item.priority, item.gap, item.objective.id),
+        )
 
-        out.sort(key=lambda item: (item.priority, item.gap, item.objective.id))
-        return out[: self.rolling_window_size]
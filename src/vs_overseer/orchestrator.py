@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import bisect
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-import json
+import math
+import os
 from pathlib import Path
+import queue
 import random
 import threading
 import time
@@ -11,9 +15,10 @@ from typing import Any
 from .api import ControlBridge, start_api_server
 from .config import AppConfig
 from .dashboard import ensure_site, write_daily_summary, write_json
+from .jsonio import dumps_bytes, loads
 from .live_runner import LiveRunner
 from .models import CanaryDecision, LiveBatchMetrics, PolicyParameters, SimBatchMetrics, utc_now_iso
-from .objective_graph import Objective, ObjectiveGraph
+from .objective_graph import Objective, ObjectiveGraph, parse_unlock_signal
 from .objective_planner import ObjectivePlanner, PlannedObjective
 from .policy_registry import CheckpointState, PolicyRecord, PolicyRegistry
 from .runtime_autotuner import RuntimeAutoTuner, RuntimeKnobs
@@ -24,6 +29,61 @@ from .tuner import PopulationTuner
 from .wiki_sync import WikiSyncer
 
 
+_WATCHDOG_CACHE_SECONDS = 1.0
+_UNLOCK_METRIC_KEYS = (
+    "collection_entries",
+    "bestiary_entries",
+    "steam_achievements",
+    "unlocked_characters_count",
+    "unlocked_arcanas_count",
+    "unlocked_weapons_count",
+    "unlocked_passives_count",
+    "unlocked_stages_count",
+    "collection_ratio",
+    "bestiary_ratio",
+    "steam_achievements_ratio",
+)
+_UNLOCK_DELTA_KEYS = tuple((key, f"{key}_delta") for key in _UNLOCK_METRIC_KEYS)
+# Fields copied from the signal into unlock_progress, in output order.
+_UNLOCK_PROGRESS_KEYS = (
+    "collection_entries",
+    "collection_target",
+    "collection_ratio",
+    "collection_entries_delta",
+    "collection_ratio_delta",
+    "bestiary_entries",
+    "bestiary_target",
+    "bestiary_ratio",
+    "bestiary_entries_delta",
+    "bestiary_ratio_delta",
+    "steam_achievements",
+    "steam_achievements_target",
+    "steam_achievements_ratio",
+    "steam_achievements_delta",
+    "steam_achievements_ratio_delta",
+    "unlocked_characters_count",
+    "unlocked_characters",
+    "unlocked_characters_count_delta",
+    "unlocked_arcanas_count",
+    "unlocked_arcanas",
+    "unlocked_arcanas_count_delta",
+    "unlocked_weapons_count",
+    "unlocked_weapons",
+    "unlocked_weapons_count_delta",
+    "unlocked_passives_count",
+    "unlocked_passives",
+    "unlocked_passives_count_delta",
+    "unlocked_stages_count",
+    "unlocked_stages",
+    "unlocked_stages_count_delta",
+    "triad_progress_delta_score",
+    "triad_progress_any_gain",
+    "save_data_age_seconds",
+    "save_data_stale",
+    "save_data_path",
+)
+
+
 @dataclass(frozen=True)
 class OrchestratorRunResult:
     generations_completed: int
@@ -32,6 +92,105 @@ class OrchestratorRunResult:
     safe_pause: bool
 
 
+class _JsonlAppender:
+    """Appends JSON lines from a background thread that keeps the file open."""
+
+    # Caps rows held in memory; append() blocks while the writer catches up.
+    MAX_QUEUED = 4096
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[bytes | None] | None = None
+        self._thread: threading.Thread | None = None
+        # Set by the writer thread when it dies: the error and the rows it had not written.
+        self._failure: tuple[OSError, list[bytes]] | None = None
+
+    def append(self, row: dict[str, Any]) -> None:
+        # Encode on the caller so later mutation of the row cannot race the writer.
+        line = dumps_bytes(row)
+        with self._lock:
+            if self._queue is None:
+                self._queue = queue.Queue(maxsize=self.MAX_QUEUED)
+                self._thread = threading.Thread(
+                    target=self._drain,
+                    args=(self._queue,),
+                    name="event-log-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+            if not self._put(line):
+                self._recover([line])
+
+    def _put(self, item: bytes | None) -> bool:
+        """Queues ``item`` unless the writer has died; called with ``_lock`` held."""
+        assert self._queue is not None and self._thread is not None
+        while self._thread.is_alive():
+            try:
+                self._queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _drain(self, lines: "queue.Queue[bytes | None]") -> None:
+        batch: list[bytes] = []
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as fh:
+                while True:
+                    line = lines.get()
+                    # Coalesce whatever queued up meanwhile into one write.
+                    while line is not None:
+                        batch.append(line)
+                        try:
+                            line = lines.get_nowait()
+                        except queue.Empty:
+                            break
+                    fh.write(b"".join(batch))
+                    fh.flush()
+                    batch.clear()
+                    if line is None:
+                        return
+        except OSError as exc:
+            self._failure = (exc, batch)
+
+    def _recover(self, extra: list[bytes]) -> None:
+        """Writes rows left by a dead writer synchronously; I/O errors reach the caller.
+
+        Must be called with ``_lock`` held. The next append starts a fresh writer.
+        """
+        lines = self._queue
+        failure = self._failure
+        self._queue, self._thread, self._failure = None, None, None
+        pending = list(failure[1]) if failure is not None else []
+        while lines is not None:
+            try:
+                line = lines.get_nowait()
+            except queue.Empty:
+                break
+            if line is not None:
+                pending.append(line)
+        pending.extend(extra)
+        if not pending:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as fh:
+            fh.write(b"".join(pending))
+
+    def close(self) -> None:
+        with self._lock:
+            thread = self._thread
+            if self._queue is None or thread is None:
+                return
+            if self._put(None):
+                # Wait for the queue to drain; the writer is a daemon, so exiting early drops rows.
+                thread.join()
+            if self._failure is not None:
+                self._recover([])
+            self._queue, self._thread = None, None
+
+
 def _to_float(raw: Any) -> float | None:
     try:
         return float(raw)
@@ -39,6 +198,19 @@ def _to_float(raw: Any) -> float | None:
         return None
 
 
+# Upper-cased token sets per list key, reused while the signal keeps the same list object.
+_UPPER_TOKEN_CACHE: dict[str, tuple[list[Any], frozenset[str]]] = {}
+
+
+def _upper_tokens(key: str, raw: list[Any]) -> frozenset[str]:
+    cached = _UPPER_TOKEN_CACHE.get(key)
+    if cached is not None and cached[0] is raw:
+        return cached[1]
+    values = frozenset(text for text in (str(item).strip().upper() for item in raw) if text)
+    _UPPER_TOKEN_CACHE[key] = (raw, values)
+    return values
+
+
 def _token_in_list(payload: dict[str, Any], key: str, token: str) -> bool | None:
     raw = payload.get(key)
     if not isinstance(raw, list):
@@ -46,110 +218,54 @@ def _token_in_list(payload: dict[str, Any], key: str, token: str) -> bool | None
     target = str(token).strip().upper()
     if not target:
         return None
-    values = {str(item).strip().upper() for item in raw if str(item).strip()}
-    return target in values
-
-
-def objective_unlock_met(unlock_signal: str, signal_payload: dict[str, Any]) -> bool | None:
-    raw = str(unlock_signal or "").strip()
-    if not raw or ":" not in raw:
+    return target in _upper_tokens(key, raw)
+
+
+# Threshold kinds name the signal metric they compare against directly.
+_THRESHOLD_UNLOCK_KINDS = frozenset(
+    {
+        "collection_ratio",
+        "collection_entries",
+        "bestiary_ratio",
+        "bestiary_entries",
+        "steam_achievements_ratio",
+        "steam_achievements",
+        "unlocked_characters_count",
+        "unlocked_arcanas_count",
+        "unlocked_weapons_count",
+        "unlocked_passives_count",
+        "unlocked_stages_count",
+    }
+)
+_TOKEN_UNLOCK_KINDS = {
+    "has_character": "unlocked_characters",
+    "has_arcana": "unlocked_arcanas",
+    "has_weapon": "unlocked_weapons",
+    "has_passive": "unlocked_passives",
+    "has_stage": "unlocked_stages",
+}
+
+
+def objective_unlock_met(
+    unlock_signal: str | tuple[str, str] | None,
+    signal_payload: dict[str, Any],
+) -> bool | None:
+    # Accepts a raw "kind:value" string or an Objective.parsed_unlock tuple.
+    parsed = unlock_signal if isinstance(unlock_signal, tuple) else parse_unlock_signal(unlock_signal)
+    if parsed is None:
         return None
+    kind, value = parsed
 
-    kind, value = raw.split(":", 1)
-    kind = kind.strip().lower()
-    value = value.strip().lower()
-
-    if kind == "collection_ratio":
-        current = _to_float(signal_payload.get("collection_ratio"))
-        target = _to_float(value)
-        if current is None or target is None:
-            return None
-        return current >= target
-
-    if kind == "collection_entries":
-        current = _to_float(signal_payload.get("collection_entries"))
-        target = _to_float(value)
-        if current is None or target is None:
-            return None
-        return current >= target
-
-    if kind == "bestiary_ratio":
-        current = _to_float(signal_payload.get("bestiary_ratio"))
-        target = _to_float(value)
-        if current is None or target is None:
-            return None
-        return current >= target
-
-    if kind == "bestiary_entries":
-        current = _to_float(signal_payload.get("bestiary_entries"))
-        target = _to_float(value)
-        if current is None or target is None:
-            return None
-        return current >= target
-
-    if kind == "steam_achievements_ratio":
-        current = _to_float(signal_payload.get("steam_achievements_ratio"))
-        target = _to_float(value)
-        if current is None or target is None:
-            return None
-        return current >= target
-
-    if kind == "steam_achievements":
-        current = _to_float(signal_payload.get("steam_achievements"))
-        target = _to_float(value)
-        if current is None or target is None:
-            return None
-        return current >= target
-
-    if kind == "unlocked_characters_count":
-        current = _to_float(signal_payload.get("unlocked_characters_count"))
-        target = _to_float(value)
-        if current is None or target is None:
-            return None
-        return current >= target
-
-    if kind == "unlocked_arcanas_count":
-        current = _to_float(signal_payload.get("unlocked_arcanas_count"))
+    if kind in _THRESHOLD_UNLOCK_KINDS:
+        current = _to_float(signal_payload.get(kind))
         target = _to_float(value)
         if current is None or target is None:
             return None
         return current >= target
 
-    if kind == "unlocked_weapons_count":
-        current = _to_float(signal_payload.get("unlocked_weapons_count"))
-        target = _to_float(value)
-        if current is None or target is None:
-            return None
-        return current >= target
-
-    if kind == "unlocked_passives_count":
-        current = _to_float(signal_payload.get("unlocked_passives_count"))
-        target = _to_float(value)
-        if current is None or target is None:
-            return None
-        return current >= target
-
-    if kind == "unlocked_stages_count":
-        current = _to_float(signal_payload.get("unlocked_stages_count"))
-        target = _to_float(value)
-        if current is None or target is None:
-            return None
-        return current >= target
-
-    if kind == "has_character":
-        return _token_in_list(signal_payload, "unlocked_characters", value)
-
-    if kind == "has_arcana":
-        return _token_in_list(signal_payload, "unlocked_arcanas", value)
-
-    if kind == "has_weapon":
-        return _token_in_list(signal_payload, "unlocked_weapons", value)
-
-    if kind == "has_passive":
-        return _token_in_list(signal_payload, "unlocked_passives", value)
-
-    if kind == "has_stage":
-        return _token_in_list(signal_payload, "unlocked_stages", value)
+    list_key = _TOKEN_UNLOCK_KINDS.get(kind)
+    if list_key is not None:
+        return _token_in_list(signal_payload, list_key, value)
 
     if kind == "completion" and value == "full_triad":
         collection = _to_float(signal_payload.get("collection_ratio"))
@@ -236,6 +352,13 @@ def strict_canary_decision(
 class Orchestrator:
     def __init__(self, cfg: AppConfig) -> None:
         self.cfg = cfg
+        # cfg is frozen, so per-loop switches and intervals are resolved once here.
+        self._game_input_enabled = bool(cfg.game_input.enabled)
+        self._planner_enabled = bool(cfg.objective_planner.enabled)
+        self._planner_heartbeat_interval_s = max(5, int(cfg.objective_planner.heartbeat_interval_seconds))
+        self._wiki_sync_interval_s = max(1, int(cfg.wiki_sync.interval_minutes)) * 60.0
+        self._watchdog_enabled = bool(cfg.live.enabled and cfg.live.progress_training_mode)
+        self._watchdog_pause_threshold_s = max(0.0, float(cfg.live.progress_stale_pause_minutes) * 60.0)
         self.events_file = cfg.resolve(cfg.runtime.events_file)
         self.db_path = cfg.resolve(cfg.runtime.database_path)
         self.policies_root = cfg.resolve("policies")
@@ -250,8 +373,27 @@ class Orchestrator:
         self.status_file = cfg.resolve(cfg.reporting.status_file)
         self.latest_summary_file = cfg.resolve(cfg.reporting.latest_summary_file)
         self.game_input_status_file = cfg.resolve(cfg.game_input.status_file)
+        self.memory_signal_path = cfg.resolve(cfg.live.memory_signal_file)
+        self._memory_signal_path_str = str(self.memory_signal_path)
+        self._signal_cache: tuple[tuple[int, int, int], dict[str, Any]] | None = None
+        raw_save_path = str(cfg.live.save_data_path or "").strip()
+        self.save_data_path: Path | None = cfg.resolve(raw_save_path) if raw_save_path else None
+        self._save_data_path_str = str(self.save_data_path) if self.save_data_path is not None else ""
+        self._watchdog_cache: tuple[float, dict[str, Any]] | None = None
+        # Status builders run every tick; their invariant parts are fixed here.
+        self._wiki_sources_file = str(self.wiki_sources_path)
+        self._wiki_mapping_file = str(self.wiki_mapping_path)
+        self._planner_mapping_file = str(self.objective_planner_path)
+        self._game_input_status_base: dict[str, Any] = {
+            "enabled": bool(cfg.game_input.enabled),
+            "active": False,
+            "ok": bool(cfg.game_input.enabled),
+            "reason": "status_unavailable" if bool(cfg.game_input.enabled) else "disabled_by_config",
+            "status_file": str(self.game_input_status_file),
+        }
 
         self.events_file.parent.mkdir(parents=True, exist_ok=True)
+        self._events = _JsonlAppender(self.events_file)
         self.site_data_dir.mkdir(parents=True, exist_ok=True)
         ensure_site(self.site_dir)
 
@@ -273,9 +415,26 @@ class Orchestrator:
         self.safety = SafetyManager(cfg.safety)
         self.bridge = ControlBridge()
 
+        # Serializes checkpoint saves and safe-pause transitions only; readers never take it.
         self._state_lock = threading.Lock()
+        # Episodes finished since the last checkpoint save; folded in by _flush_episode_count.
+        self._episode_lock = threading.Lock()
+        self._pending_episodes = 0
         self._checkpoint = self.registry.load_checkpoint()
+        # Set when the in-memory checkpoint diverges from the last save; the heartbeat persists it.
+        self._checkpoint_dirty = threading.Event()
+        # Set view of population_state["completed_objectives"], which is kept sorted and
+        # unique so _mark_completed can insort into it; update via _mark_completed.
+        self._completed_objectives: set[str] = set(
+            self._checkpoint.population_state.get("completed_objectives", [])
+        )
+        self._checkpoint.population_state["completed_objectives"] = sorted(self._completed_objectives)
         self._heartbeat_stop = threading.Event()
+        # Wakes the heartbeat thread to persist a finished generation off the main loop.
+        self._checkpoint_wake = threading.Event()
+        # Set with _checkpoint_error when a heartbeat save fails; cleared by the next successful save.
+        self._checkpoint_failed = threading.Event()
+        self._checkpoint_error: Exception | None = None
         self._api_server = None
         self._api_thread = None
         self._generation = 0
@@ -289,11 +448,17 @@ class Orchestrator:
             loop_sleep_seconds=self.cfg.runtime.loop_sleep_seconds,
         )
         self._autotuner = RuntimeAutoTuner(self.cfg, self._runtime_knobs)
+        # Each status_payload() call builds a fresh dict; treat it as read-only once published.
         self._autotune_status = self._autotuner.status_payload()
         self._last_unlock_metrics: dict[str, float] | None = None
-        self._planned_queue_cache: list[PlannedObjective] = self._planned_from_checkpoint()
+        self._planned_parse_cache: tuple[list[Any], list[PlannedObjective]] | None = None
+        self._planned_queue_cache: list[PlannedObjective] = []
+        self._planned_queue_signature = ""
+        self._planned_queue_rows: list[dict[str, Any]] | None = None
+        self._set_planned_queue(self._planned_from_checkpoint())
         self._planned_queue_last_refresh_generation = -1
-        self._planner_heartbeat_last_mono = 0.0
+        self._loop_plan_inputs: tuple[dict[str, Any], ObjectivePlanner | None, int] | None = None
+        self._planner_heartbeat_next_due_mono = 0.0
         self._planner_heartbeat_last_signature = ""
         self._wiki_syncer: WikiSyncer | None = None
         self._wiki_sync_status: dict[str, Any] = {
@@ -303,8 +468,8 @@ class Orchestrator:
             "changed": False,
             "reason": "disabled",
             "last_synced_at": "",
-            "sources_file": str(self.wiki_sources_path),
-            "mapping_file": str(self.wiki_mapping_path),
+            "sources_file": self._wiki_sources_file,
+            "mapping_file": self._wiki_mapping_file,
         }
         if bool(self.cfg.wiki_sync.enabled):
             self._wiki_syncer = WikiSyncer(
@@ -319,10 +484,10 @@ class Orchestrator:
                 "changed": False,
                 "reason": "pending_first_sync",
                 "last_synced_at": "",
-                "sources_file": str(self.wiki_sources_path),
-                "mapping_file": str(self.wiki_mapping_path),
+                "sources_file": self._wiki_sources_file,
+                "mapping_file": self._wiki_mapping_file,
             }
-        self._wiki_sync_last_mono = 0.0
+        self._wiki_sync_next_due_mono = 0.0
 
     def _append_event(self, *, phase: str, event_type: str, severity: str, payload: dict[str, Any]) -> None:
         row = {
@@ -332,22 +497,68 @@ class Orchestrator:
             "severity": severity,
             "payload": payload,
         }
-        self.events_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.events_file.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(row, ensure_ascii=True) + "\n")
+        self._events.append(row)
+
+    def _checkpoint_episode_increment(self, _episode: Any = None) -> None:
+        # Hot path for parallel episode workers: count only, persist on the next save.
+        # Accepts the episode row so it can be passed to the simulator without a wrapper.
+        with self._episode_lock:
+            self._pending_episodes += 1
+
+    def _flush_episode_count(self) -> None:
+        with self._episode_lock:
+            pending = self._pending_episodes
+            self._pending_episodes = 0
+        if pending:
+            counters = self._checkpoint.failure_counters
+            counters["episodes_completed"] = int(counters.get("episodes_completed", 0)) + pending
+
+    def _persist_checkpoint(self) -> None:
+        # Caller holds _state_lock.
+        self._flush_episode_count()
+        self._checkpoint_dirty.clear()
+        try:
+            self.registry.save_checkpoint(self._checkpoint)
+        except Exception:
+            self._checkpoint_dirty.set()
+            raise
+        self._checkpoint_error = None
+        self._checkpoint_failed.clear()
 
-    def _checkpoint_episode_increment(self) -> None:
+    def _persist_checkpoint_if_dirty(self) -> None:
         with self._state_lock:
-            counters = dict(self._checkpoint.failure_counters)
-            counters["episodes_completed"] = int(counters.get("episodes_completed", 0)) + 1
-            self._checkpoint.failure_counters = counters
-            self.registry.save_checkpoint(self._checkpoint)
+            if self._checkpoint_dirty.is_set() or self._pending_episodes:
+                self._persist_checkpoint()
 
     def _heartbeat_loop(self) -> None:
         interval = max(5, int(self.cfg.runtime.checkpoint_interval_seconds))
-        while not self._heartbeat_stop.wait(timeout=interval):
-            with self._state_lock:
-                self.registry.save_checkpoint(self._checkpoint)
+        while True:
+            self._checkpoint_wake.wait(timeout=interval)
+            self._checkpoint_wake.clear()
+            if self._heartbeat_stop.is_set():
+                # run() does the final synchronous save after joining this thread.
+                return
+            try:
+                self._persist_checkpoint_if_dirty()
+            except Exception as exc:  # noqa: BLE001
+                # run() checks this before each generation and retries the save itself.
+                self._checkpoint_error = exc
+                self._checkpoint_failed.set()
+                self._append_event(
+                    phase="checkpoint",
+                    event_type="save_failed",
+                    severity="warning",
+                    payload={"error": str(exc)},
+                )
+
+    def _check_background_save(self) -> None:
+        """Retries a checkpoint save the heartbeat failed; raises if it fails again.
+
+        Running further generations would commit registry changes that the
+        checkpoint never records, so a failure is handled like a failed generation.
+        """
+        if self._checkpoint_failed.is_set():
+            self._persist_checkpoint_if_dirty()
 
     def _update_health(self, *, state: str, note: str = "") -> None:
         snapshot = self.bridge.snapshot()
@@ -363,41 +574,38 @@ class Orchestrator:
             "recoveries_30m": self.safety.recovery_count(),
             "sim_backend": self._last_backend,
             "last_error": self._last_error,
+            "checkpoint_error": str(self._checkpoint_error or ""),
             "note": note,
-            "autotune": dict(self._autotune_status),
+            "autotune": self._autotune_status,
             "progress_watchdog": watchdog,
             "objective_planner": self._objective_planner_status(),
             "wiki_sync": self._wiki_sync_status_payload(),
             "game_input": self._game_input_status_payload(),
         }
-        write_json(self.status_file, payload)
-        self.bridge.update_health(payload)
+        self.bridge.update_health(payload, write_json(self.status_file, payload))
 
     def _update_summary(self, payload: dict[str, Any]) -> None:
-        write_json(self.latest_summary_file, payload)
-        self.bridge.update_summary(payload)
+        self.bridge.update_summary(payload, write_json(self.latest_summary_file, payload))
         write_daily_summary(self.summary_dir, payload)
 
     @staticmethod
     def _extract_unlock_metrics(payload: dict[str, Any]) -> dict[str, float]:
-        keys = [
-            "collection_entries",
-            "bestiary_entries",
-            "steam_achievements",
-            "unlocked_characters_count",
-            "unlocked_arcanas_count",
-            "unlocked_weapons_count",
-            "unlocked_passives_count",
-            "unlocked_stages_count",
-            "collection_ratio",
-            "bestiary_ratio",
-            "steam_achievements_ratio",
-        ]
         out: dict[str, float] = {}
-        for key in keys:
-            value = _to_float(payload.get(key))
-            if value is not None:
-                out[key] = float(value)
+        get = payload.get
+        for key in _UNLOCK_METRIC_KEYS:
+            raw = get(key)
+            # Decoded JSON numbers skip the try/except in _to_float; bools still go through it.
+            # NaN/Infinity are dropped since the checkpoint cannot serialize them.
+            kind = type(raw)
+            if kind is float:
+                if math.isfinite(raw):
+                    out[key] = raw
+            elif kind is int:
+                out[key] = float(raw)
+            elif raw is not None:
+                value = _to_float(raw)
+                if value is not None and math.isfinite(value):
+                    out[key] = value
         return out
 
     def _augment_signal_with_unlock_deltas(self, payload: dict[str, Any]) -> dict[str, Any]:
@@ -407,26 +615,13 @@ class Orchestrator:
         current = self._extract_unlock_metrics(enriched)
         previous = self._last_unlock_metrics or {}
 
-        for key in [
-            "collection_entries",
-            "bestiary_entries",
-            "steam_achievements",
-            "unlocked_characters_count",
-            "unlocked_arcanas_count",
-            "unlocked_weapons_count",
-            "unlocked_passives_count",
-            "unlocked_stages_count",
-            "collection_ratio",
-            "bestiary_ratio",
-            "steam_achievements_ratio",
-        ]:
+        for key, delta_key in _UNLOCK_DELTA_KEYS:
             cur = current.get(key)
             prev = previous.get(key)
-            delta_key = f"{key}_delta"
             if cur is None or prev is None:
                 enriched[delta_key] = None
             else:
-                enriched[delta_key] = float(cur - prev)
+                enriched[delta_key] = cur - prev
 
         collection_gain = max(0.0, float(enriched.get("collection_entries_delta") or 0.0))
         bestiary_gain = max(0.0, float(enriched.get("bestiary_entries_delta") or 0.0))
@@ -460,6 +655,11 @@ class Orchestrator:
         rows = self._checkpoint.population_state.get("planned_objectives", [])
         if not isinstance(rows, list):
             return []
+        # The planned rows are only ever replaced wholesale, so the list object
+        # itself identifies the parse.
+        cached = self._planned_parse_cache
+        if cached is not None and cached[0] is rows:
+            return list(cached[1])
         out: list[PlannedObjective] = []
         for row in rows:
             if not isinstance(row, dict):
@@ -468,11 +668,12 @@ class Orchestrator:
                 out.append(PlannedObjective.from_dict(row))
             except Exception:  # noqa: BLE001
                 continue
-        return out
+        self._planned_parse_cache = (rows, out)
+        return list(out)
 
     def _refresh_objective_queue(self, *, signal_payload: dict[str, Any], force: bool = False) -> list[PlannedObjective]:
         if self.objective_planner is None:
-            self._planned_queue_cache = self._planned_from_checkpoint()
+            self._set_planned_queue(self._planned_from_checkpoint())
             return list(self._planned_queue_cache)
 
         refresh_every = max(1, int(self.cfg.objective_planner.refresh_every_generations))
@@ -484,13 +685,28 @@ class Orchestrator:
         ):
             return list(self._planned_queue_cache)
 
-        completed = set(self._checkpoint.population_state.get("completed_objectives", []))
-        planned = self.objective_planner.plan(signal_payload=signal_payload, completed_ids=completed)
-        self._planned_queue_cache = planned
+        planned = self.objective_planner.plan(signal_payload=signal_payload, completed_ids=self._completed_objectives)
+        self._set_planned_queue(planned)
         self._planned_queue_last_refresh_generation = self._checkpoint.loop_cursor
-        self._checkpoint.population_state["planned_objectives"] = [item.to_dict() for item in planned]
+        rows = self._planned_queue_dicts()
+        if rows != self._checkpoint.population_state.get("planned_objectives"):
+            self._checkpoint.population_state["planned_objectives"] = rows
+            self._checkpoint_dirty.set()
         return list(planned)
 
+    def _plan_inputs_changed(self, signal_payload: dict[str, Any]) -> bool:
+        # The cached signal dict is only replaced when the file changes, so identity
+        # checks are enough to skip replanning on idle loop ticks.
+        inputs = (signal_payload, self.objective_planner, len(self._completed_objectives))
+        last = self._loop_plan_inputs
+        self._loop_plan_inputs = inputs
+        return (
+            last is None
+            or last[0] is not inputs[0]
+            or last[1] is not inputs[1]
+            or last[2] != inputs[2]
+        )
+
     def _reload_objective_planner(self) -> None:
         if not bool(self.cfg.objective_planner.enabled):
             self.objective_planner = None
@@ -507,15 +723,18 @@ class Orchestrator:
             self._objective_planner_error = f"planner_load_error:{exc}"
 
     def _objective_planner_status(self, *, signal_payload: dict[str, Any] | None = None) -> dict[str, Any]:
-        queue = self._planned_queue_cache or self._planned_from_checkpoint()
+        if self._planned_queue_cache:
+            queue_rows = self._planned_queue_dicts()
+        else:
+            queue_rows = [item.to_dict() for item in self._planned_from_checkpoint()]
         payload: dict[str, Any] = {
             "enabled": bool(self.cfg.objective_planner.enabled),
             "active": bool(self.objective_planner is not None),
             "error": self._objective_planner_error,
-            "mapping_file": str(self.objective_planner_path),
+            "mapping_file": self._planner_mapping_file,
             "rolling_window_size": int(self.cfg.objective_planner.rolling_window_size),
-            "queue_size": len(queue),
-            "queue": [item.to_dict() for item in queue],
+            "queue_size": len(queue_rows),
+            "queue": queue_rows,
         }
         if signal_payload:
             payload["signal_available"] = True
@@ -524,22 +743,17 @@ class Orchestrator:
         return payload
 
     def _wiki_sync_status_payload(self) -> dict[str, Any]:
-        return dict(self._wiki_sync_status)
+        # The status dict is replaced, never mutated, so it is shared without copying.
+        return self._wiki_sync_status
 
     def _game_input_status_payload(self) -> dict[str, Any]:
-        payload: dict[str, Any] = {
-            "enabled": bool(self.cfg.game_input.enabled),
-            "active": False,
-            "ok": bool(self.cfg.game_input.enabled),
-            "reason": "disabled_by_config" if not bool(self.cfg.game_input.enabled) else "status_unavailable",
-            "status_file": str(self.game_input_status_file),
-        }
-        if not bool(self.cfg.game_input.enabled):
-            return payload
-        if not self.game_input_status_file.exists():
+        payload = self._game_input_status_base.copy()
+        if not self._game_input_enabled:
             return payload
         try:
-            row = json.loads(self.game_input_status_file.read_text(encoding="utf-8"))
+            row = loads(self.game_input_status_file.read_bytes())
+        except FileNotFoundError:
+            return payload
         except Exception as exc:  # noqa: BLE001
             payload["ok"] = False
             payload["reason"] = f"status_parse_error:{exc}"
@@ -549,9 +763,9 @@ class Orchestrator:
             payload["reason"] = "status_invalid_type"
             return payload
 
-        merged = dict(payload)
+        merged = payload
         merged.update(row)
-        merged["enabled"] = bool(self.cfg.game_input.enabled)
+        merged["enabled"] = self._game_input_enabled
         merged["active"] = True
         agent_error = merged.get("error") or merged.get("last_error")
         if agent_error:
@@ -562,31 +776,30 @@ class Orchestrator:
         else:
             merged["reason"] = "ok" if bool(merged.get("ok", True)) else "agent_reported_not_ok"
         if "status_file" not in merged:
-            merged["status_file"] = str(self.game_input_status_file)
+            merged["status_file"] = self._game_input_status_base["status_file"]
         return merged
 
     def _maybe_wiki_sync(self) -> None:
         if self._wiki_syncer is None:
             return
         now_mono = time.monotonic()
-        interval_s = max(1, int(self.cfg.wiki_sync.interval_minutes)) * 60.0
-        if self._wiki_sync_last_mono > 0.0 and (now_mono - self._wiki_sync_last_mono) < interval_s:
+        if now_mono < self._wiki_sync_next_due_mono:
             return
 
-        self._wiki_sync_last_mono = now_mono
+        self._wiki_sync_next_due_mono = now_mono + self._wiki_sync_interval_s
         try:
             result = self._wiki_syncer.sync()
             status = result.to_dict()
             status["enabled"] = True
             status["active"] = True
             status["last_synced_at"] = status.get("synced_at", "")
-            status["sources_file"] = str(self.wiki_sources_path)
-            status["mapping_file"] = str(self.wiki_mapping_path)
+            status["sources_file"] = self._wiki_sources_file
+            status["mapping_file"] = self._wiki_mapping_file
             self._wiki_sync_status = status
 
             if bool(result.changed):
                 self._reload_objective_planner()
-                self._planned_queue_cache = []
+                self._set_planned_queue([])
                 self._planned_queue_last_refresh_generation = -1
                 self._append_event(
                     phase="objective_planner",
@@ -606,27 +819,37 @@ class Orchestrator:
                 "changed": False,
                 "reason": f"sync_error:{exc}",
                 "last_synced_at": utc_now_iso(),
-                "sources_file": str(self.wiki_sources_path),
-                "mapping_file": str(self.wiki_mapping_path),
+                "sources_file": self._wiki_sources_file,
+                "mapping_file": self._wiki_mapping_file,
             }
 
+    def _set_planned_queue(self, queue: list[PlannedObjective]) -> None:
+        self._planned_queue_cache = queue
+        self._planned_queue_signature = "|".join(item.objective.id for item in queue)
+        self._planned_queue_rows = None
+
+    def _planned_queue_dicts(self) -> list[dict[str, Any]]:
+        # Serialized once per queue; health, summaries and the checkpoint share the read-only rows.
+        if self._planned_queue_rows is None:
+            self._planned_queue_rows = [item.to_dict() for item in self._planned_queue_cache]
+        return self._planned_queue_rows
+
     def _planner_heartbeat_signature(self) -> str:
-        queue = self._planned_queue_cache or self._planned_from_checkpoint()
-        parts = [item.objective.id for item in queue]
-        return "|".join(parts)
+        if self._planned_queue_cache:
+            return self._planned_queue_signature
+        # An empty cache falls back to the checkpoint rows, as the queue readers do.
+        return "|".join(item.objective.id for item in self._planned_from_checkpoint())
 
     def _emit_objective_planner_heartbeat(self, *, signal_payload: dict[str, Any] | None = None) -> None:
-        if not bool(self.cfg.objective_planner.enabled):
+        if not self._planner_enabled:
             return
         now_mono = time.monotonic()
-        interval = max(5, int(self.cfg.objective_planner.heartbeat_interval_seconds))
         signature = self._planner_heartbeat_signature()
-        if (now_mono - self._planner_heartbeat_last_mono) < interval and signature == self._planner_heartbeat_last_signature:
+        if now_mono < self._planner_heartbeat_next_due_mono and signature == self._planner_heartbeat_last_signature:
             return
 
         queue = self._planned_queue_cache or self._planned_from_checkpoint()
-        completed = set(self._checkpoint.population_state.get("completed_objectives", []))
-        next_obj = self._next_objective(completed=completed, planned_queue=queue)
+        next_obj = self._next_objective(completed=self._completed_objectives, planned_queue=queue)
 
         row = {
             "ts": utc_now_iso(),
@@ -641,11 +864,17 @@ class Orchestrator:
             "progress_watchdog": self._progress_watchdog_status(),
             "wiki_sync": self._wiki_sync_status_payload(),
         }
-        self.objective_planner_heartbeat_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.objective_planner_heartbeat_path.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(row, ensure_ascii=True) + "\n")
-
-        self._planner_heartbeat_last_mono = now_mono
+        line = dumps_bytes(row)
+        try:
+            with self.objective_planner_heartbeat_path.open("ab") as fh:
+                fh.write(line)
+        except FileNotFoundError:
+            # Only the first write (or one after the log dir was removed) needs mkdir.
+            self.objective_planner_heartbeat_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.objective_planner_heartbeat_path.open("ab") as fh:
+                fh.write(line)
+
+        self._planner_heartbeat_next_due_mono = now_mono + self._planner_heartbeat_interval_s
         self._planner_heartbeat_last_signature = signature
 
     def _next_objective(
@@ -661,7 +890,7 @@ class Orchestrator:
 
     def _progress_watchdog_status(self) -> dict[str, Any]:
         status = {
-            "enabled": bool(self.cfg.live.enabled and self.cfg.live.progress_training_mode),
+            "enabled": self._watchdog_enabled,
             "ok": True,
             "stale": False,
             "reason": "disabled",
@@ -672,34 +901,46 @@ class Orchestrator:
         if not status["enabled"]:
             return status
 
-        raw = str(self.cfg.live.save_data_path or "").strip()
-        if not raw:
+        path = self.save_data_path
+        if path is None:
             status["ok"] = False
             status["reason"] = "save_data_path_unset"
             return status
 
-        path = self.cfg.resolve(raw)
-        status["save_data_path"] = str(path)
-        if not path.exists():
+        # Several callers ask per loop iteration; a sub-second answer is fresh
+        # enough for a minutes-scale staleness check.
+        now_mono = time.monotonic()
+        cached = self._watchdog_cache
+        if cached is not None and now_mono - cached[0] < _WATCHDOG_CACHE_SECONDS:
+            return dict(cached[1])
+
+        path_str = self._save_data_path_str
+        status["save_data_path"] = path_str
+        try:
+            mtime = os.stat(path_str).st_mtime
+        except OSError:
             status["ok"] = False
             status["reason"] = "save_data_missing"
-            return status
+            self._watchdog_cache = (now_mono, status)
+            return dict(status)
 
-        age_s = max(0.0, time.time() - path.stat().st_mtime)
-        pause_threshold_s = max(0.0, float(self.cfg.live.progress_stale_pause_minutes) * 60.0)
+        age_s = max(0.0, time.time() - mtime)
+        pause_threshold_s = self._watchdog_pause_threshold_s
         stale = pause_threshold_s > 0.0 and age_s > pause_threshold_s
         status["save_data_age_seconds"] = float(age_s)
         status["pause_threshold_seconds"] = float(pause_threshold_s)
         status["stale"] = bool(stale)
         status["ok"] = not bool(stale)
         status["reason"] = "ok" if not stale else f"save_data_stale:{age_s:.1f}s>{pause_threshold_s:.1f}s"
-        return status
+        self._watchdog_cache = (now_mono, status)
+        return dict(status)
 
     def _set_safe_pause(self, reason: str) -> None:
         with self._state_lock:
             self._checkpoint.safe_pause = True
             self._checkpoint.safe_pause_reason = reason
-            self.registry.save_checkpoint(self._checkpoint)
+            # Pauses must survive a crash, so they are written through immediately.
+            self._persist_checkpoint()
         self.bridge.request_pause(reason)
         self._append_event(
             phase="safety",
@@ -712,7 +953,7 @@ class Orchestrator:
         with self._state_lock:
             self._checkpoint.safe_pause = False
             self._checkpoint.safe_pause_reason = ""
-            self.registry.save_checkpoint(self._checkpoint)
+            self._checkpoint_dirty.set()
         self.bridge.request_resume()
 
     def _bootstrap(self) -> PolicyRecord:
@@ -735,7 +976,7 @@ class Orchestrator:
         signal_payload: dict[str, Any] | None = None,
         planned_queue: list[PlannedObjective] | None = None,
     ) -> str | None:
-        completed = set(self._checkpoint.population_state.get("completed_objectives", []))
+        completed = self._completed_objectives
         if planned_queue is None:
             planned_queue = self._planned_queue_cache or self._planned_from_checkpoint()
         next_obj = self._next_objective(completed=completed, planned_queue=planned_queue)
@@ -743,20 +984,38 @@ class Orchestrator:
             return None
         if signal_payload is None:
             signal_payload = self._objective_signal_payload()
-        signal_match = objective_unlock_met(next_obj.unlock_signal, signal_payload)
+        signal_match = objective_unlock_met(next_obj.parsed_unlock, signal_payload)
         objective_met = signal_match if signal_match is not None else (champion.objective_rate >= 0.65)
         if objective_met:
-            completed.add(next_obj.id)
-            self._checkpoint.population_state["completed_objectives"] = sorted(completed)
+            self._mark_completed(next_obj.id)
             return next_obj.id
         return None
 
+    def _mark_completed(self, objective_id: str) -> None:
+        if objective_id in self._completed_objectives:
+            return
+        self._completed_objectives.add(objective_id)
+        bisect.insort(self._checkpoint.population_state["completed_objectives"], objective_id)
+        self._checkpoint_dirty.set()
+
     def _objective_signal_payload(self) -> dict[str, Any]:
-        path = self.cfg.resolve(self.cfg.live.memory_signal_file)
-        if not path.exists():
+        # Callers treat the result as read-only, so an unchanged file returns the cached dict.
+        try:
+            st = os.stat(self._memory_signal_path_str)
+        except OSError:
+            self._signal_cache = None
             return {}
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._signal_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        payload = self._read_objective_signal()
+        self._signal_cache = (key, payload)
+        return payload
+
+    def _read_objective_signal(self) -> dict[str, Any]:
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = loads(self.memory_signal_path.read_bytes())
         except Exception:  # noqa: BLE001
             return {}
         if not isinstance(payload, dict):
@@ -769,43 +1028,8 @@ class Orchestrator:
         payload = signal_payload if signal_payload is not None else self._objective_signal_payload()
         if not payload:
             return {}
-        return {
-            "collection_entries": payload.get("collection_entries"),
-            "collection_target": payload.get("collection_target"),
-            "collection_ratio": payload.get("collection_ratio"),
-            "collection_entries_delta": payload.get("collection_entries_delta"),
-            "collection_ratio_delta": payload.get("collection_ratio_delta"),
-            "bestiary_entries": payload.get("bestiary_entries"),
-            "bestiary_target": payload.get("bestiary_target"),
-            "bestiary_ratio": payload.get("bestiary_ratio"),
-            "bestiary_entries_delta": payload.get("bestiary_entries_delta"),
-            "bestiary_ratio_delta": payload.get("bestiary_ratio_delta"),
-            "steam_achievements": payload.get("steam_achievements"),
-            "steam_achievements_target": payload.get("steam_achievements_target"),
-            "steam_achievements_ratio": payload.get("steam_achievements_ratio"),
-            "steam_achievements_delta": payload.get("steam_achievements_delta"),
-            "steam_achievements_ratio_delta": payload.get("steam_achievements_ratio_delta"),
-            "unlocked_characters_count": payload.get("unlocked_characters_count"),
-            "unlocked_characters": payload.get("unlocked_characters"),
-            "unlocked_characters_count_delta": payload.get("unlocked_characters_count_delta"),
-            "unlocked_arcanas_count": payload.get("unlocked_arcanas_count"),
-            "unlocked_arcanas": payload.get("unlocked_arcanas"),
-            "unlocked_arcanas_count_delta": payload.get("unlocked_arcanas_count_delta"),
-            "unlocked_weapons_count": payload.get("unlocked_weapons_count"),
-            "unlocked_weapons": payload.get("unlocked_weapons"),
-            "unlocked_weapons_count_delta": payload.get("unlocked_weapons_count_delta"),
-            "unlocked_passives_count": payload.get("unlocked_passives_count"),
-            "unlocked_passives": payload.get("unlocked_passives"),
-            "unlocked_passives_count_delta": payload.get("unlocked_passives_count_delta"),
-            "unlocked_stages_count": payload.get("unlocked_stages_count"),
-            "unlocked_stages": payload.get("unlocked_stages"),
-            "unlocked_stages_count_delta": payload.get("unlocked_stages_count_delta"),
-            "triad_progress_delta_score": payload.get("triad_progress_delta_score"),
-            "triad_progress_any_gain": payload.get("triad_progress_any_gain"),
-            "save_data_age_seconds": payload.get("save_data_age_seconds"),
-            "save_data_stale": payload.get("save_data_stale"),
-            "save_data_path": payload.get("save_data_path"),
-        }
+        get = payload.get
+        return {key: get(key) for key in _UNLOCK_PROGRESS_KEYS}
 
     def _active_policy(self) -> PolicyRecord:
         active = self.registry.get_policy(self._checkpoint.active_policy_id)
@@ -815,7 +1039,9 @@ class Orchestrator:
         return active
 
     def _handle_regression_window(self, active_score: float) -> tuple[bool, str]:
-        counters = dict(self._checkpoint.failure_counters)
+        # Updated in place: the heartbeat thread also writes episodes_completed into
+        # this dict, and a copy-and-reassign from either side could drop the other's key.
+        counters = self._checkpoint.failure_counters
         prev = float(counters.get("last_active_score", 0.0))
         windows = int(counters.get("regression_windows", 0))
 
@@ -830,7 +1056,6 @@ class Orchestrator:
 
         counters["regression_windows"] = windows
         counters["last_active_score"] = float(active_score)
-        self._checkpoint.failure_counters = counters
 
         limit = self.cfg.automation.regression_windows_before_rollback
         if windows >= limit:
@@ -839,7 +1064,6 @@ class Orchestrator:
                 self._checkpoint.active_policy_id = last_stable
                 self.registry.set_active_policy(last_stable)
                 counters["regression_windows"] = 0
-                self._checkpoint.failure_counters = counters
                 return True, f"rollback_to_{last_stable}"
         return False, "no_rollback"
 
@@ -864,18 +1088,26 @@ class Orchestrator:
         champion = top_k[0]
         baseline_result = next((x for x in eval_results if x.candidate_id == "baseline"), champion)
 
-        baseline_canary_metrics, _, _ = self.simulator.run_batch(
-            parameters=active.parameters,
-            episodes=self._runtime_knobs.canary_sim_episodes,
-            seed=seed + 100000,
-            on_episode=lambda _ep: self._checkpoint_episode_increment(),
-        )
-        candidate_canary_metrics, _, _ = self.simulator.run_batch(
-            parameters=champion.parameters,
-            episodes=self._runtime_knobs.canary_sim_episodes,
-            seed=seed + 200000,
-            on_episode=lambda _ep: self._checkpoint_episode_increment(),
-        )
+        # The two sim canaries are independent, so they run side by side like the
+        # population batches; seeds stay fixed per side, so results do not depend on order.
+        canary_workers = min(2, max(1, int(self._runtime_knobs.max_parallel_workers)))
+        with ThreadPoolExecutor(max_workers=canary_workers) as ex:
+            baseline_canary = ex.submit(
+                self.simulator.run_batch,
+                parameters=active.parameters,
+                episodes=self._runtime_knobs.canary_sim_episodes,
+                seed=seed + 100000,
+                on_episode=self._checkpoint_episode_increment,
+            )
+            candidate_canary = ex.submit(
+                self.simulator.run_batch,
+                parameters=champion.parameters,
+                episodes=self._runtime_knobs.canary_sim_episodes,
+                seed=seed + 200000,
+                on_episode=self._checkpoint_episode_increment,
+            )
+            baseline_canary_metrics, _, _ = baseline_canary.result()
+            candidate_canary_metrics, _, _ = candidate_canary.result()
 
         baseline_canary_score = weighted_score(baseline_canary_metrics, effective_scoring).total
         candidate_canary_score = weighted_score(candidate_canary_metrics, effective_scoring).total
@@ -941,7 +1173,8 @@ class Orchestrator:
 
         self._checkpoint.loop_cursor += 1
         self._checkpoint.last_success_ts = utc_now_iso()
-        self.registry.save_checkpoint(self._checkpoint)
+        self._checkpoint_dirty.set()
+        self._checkpoint_wake.set()
 
         summary = {
             "generated_at": utc_now_iso(),
@@ -951,7 +1184,9 @@ class Orchestrator:
             "promotion_state": promotion_state,
             "decision": decision.to_dict(),
             "objective_hit": objective_hit,
-            "unlock_progress": self._unlock_progress_snapshot(signal_payload=objective_signal),
+            "unlock_progress": (
+                self._unlock_progress_snapshot(signal_payload=objective_signal) if objective_signal else {}
+            ),
             "unlock_trend": {
                 "collection_entries_delta": objective_signal.get("collection_entries_delta"),
                 "bestiary_entries_delta": objective_signal.get("bestiary_entries_delta"),
@@ -988,6 +1223,14 @@ class Orchestrator:
         }
         return summary
 
+    def _shutdown_api(self) -> None:
+        if self._api_server is not None:
+            try:
+                self._api_server.shutdown()
+                self._api_server.server_close()
+            except Exception:
+                pass
+
     def run(
         self,
         *,
@@ -996,15 +1239,22 @@ class Orchestrator:
         api_port: int = 8787,
         enable_api: bool = True,
     ) -> OrchestratorRunResult:
-        self._bootstrap()
-        self._heartbeat_stop.clear()
-        heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="checkpoint-heartbeat", daemon=True)
-        heartbeat_thread.start()
-
+        # Bind the control API before bootstrapping so it is reachable during startup;
+        # a stop or pause sent meanwhile is honoured on the first loop check.
         if enable_api:
             self._api_server, self._api_thread = start_api_server(self.bridge, host=api_host, port=api_port)
         else:
             self._api_server, self._api_thread = None, None
+        try:
+            self._bootstrap()
+        except Exception:
+            self._shutdown_api()
+            self.registry.close()
+            raise
+
+        self._heartbeat_stop.clear()
+        heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="checkpoint-heartbeat", daemon=True)
+        heartbeat_thread.start()
 
         stop_reason = "unknown"
         attempt = 0
@@ -1021,7 +1271,7 @@ class Orchestrator:
                 snapshot = self.bridge.snapshot()
                 self._maybe_wiki_sync()
                 signal_payload = self._objective_signal_payload()
-                if signal_payload:
+                if signal_payload and self._plan_inputs_changed(signal_payload):
                     self._refresh_objective_queue(signal_payload=signal_payload, force=True)
                 self._emit_objective_planner_heartbeat(signal_payload=signal_payload)
                 watchdog = self._progress_watchdog_status()
@@ -1032,7 +1282,7 @@ class Orchestrator:
                     if not self._checkpoint.safe_pause:
                         self._set_safe_pause(reason)
                     self._update_health(state="SAFE_PAUSE", note=str(watchdog.get("reason", "save_data_stale")))
-                    time.sleep(max(0.2, self._runtime_knobs.loop_sleep_seconds))
+                    self.bridge.wait_for_request(max(0.2, self._runtime_knobs.loop_sleep_seconds))
                     continue
 
                 if (
@@ -1051,13 +1301,14 @@ class Orchestrator:
 
                 if self._checkpoint.safe_pause:
                     self._update_health(state="SAFE_PAUSE", note=self._checkpoint.safe_pause_reason)
-                    time.sleep(max(0.2, self._runtime_knobs.loop_sleep_seconds))
+                    self.bridge.wait_for_request(max(0.2, self._runtime_knobs.loop_sleep_seconds))
                     continue
 
                 self._generation += 1
                 seed = int(time.time() * 1000) + self._generation
 
                 try:
+                    self._check_background_save()
                     summary = self._run_generation(seed=seed)
                     recoveries = self.safety.recovery_count()
                     self._runtime_knobs, autotune_decision = self._autotuner.observe_generation(
@@ -1116,20 +1367,32 @@ class Orchestrator:
 
                     backoff = self.safety.backoff_seconds(attempt - 1)
                     self._update_health(state="RECOVERING", note=f"retry_in_{backoff}s")
-                    time.sleep(max(1, backoff))
+                    self.bridge.wait_for_request(max(1, backoff))
                     continue
 
-                time.sleep(max(0.2, float(self._runtime_knobs.loop_sleep_seconds)))
+                self.bridge.wait_for_request(max(0.2, float(self._runtime_knobs.loop_sleep_seconds)))
         finally:
             self._heartbeat_stop.set()
+            self._checkpoint_wake.set()
             heartbeat_thread.join(timeout=2.0)
-            if self._api_server is not None:
-                try:
-                    self._api_server.shutdown()
-                    self._api_server.server_close()
-                except Exception:
-                    pass
-            self._update_health(state="STOPPED", note=stop_reason)
+            try:
+                self._persist_checkpoint_if_dirty()
+            except Exception as exc:  # noqa: BLE001
+                self._append_event(
+                    phase="checkpoint",
+                    event_type="save_failed",
+                    severity="critical",
+                    payload={"error": str(exc), "final": True},
+                )
+                raise
+            finally:
+                # Shutdown must complete even when the final save fails.
+                self._shutdown_api()
+                self._update_health(state="STOPPED", note=stop_reason)
+                # The heartbeat thread is joined and the final save attempted; release the connection.
+                self.registry.close()
+                # Last, since it re-raises a write error the event writer hit.
+                self._events.close()
 
         return OrchestratorRunResult(
             generations_completed=self._checkpoint.loop_cursor,
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from contextlib import contextmanager
-import json
 from pathlib import Path
 import sqlite3
+import threading
 from typing import Any
 import uuid
 
+from .jsonio import dumps_bytes, loads
 from .models import PolicyParameters, utc_now_iso
 
 
@@ -35,27 +36,39 @@ class CheckpointState:
     updated_at: str
 
 
+def _encode(value: Any) -> bytes:
+    # JSON columns hold UTF-8 bytes; rows written as TEXT by older versions still decode.
+    return dumps_bytes(value, newline=False)
+
+
 class PolicyRegistry:
     def __init__(self, database_path: Path, policies_root: Path) -> None:
         self.database_path = database_path
         self.policies_root = policies_root
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
         self.policies_root.mkdir(parents=True, exist_ok=True)
+        # One connection shared by the main loop and the checkpoint heartbeat thread.
+        # Re-entrant because bootstrap_baseline calls get_policy inside a session.
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.database_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._setup()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.database_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
 
     @contextmanager
     def _session(self):
-        conn = self._connect()
-        try:
-            yield conn
-            conn.commit()
-        finally:
-            conn.close()
+        with self._lock:
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
 
     def _setup(self) -> None:
         with self._session() as conn:
@@ -65,11 +78,11 @@ class PolicyRegistry:
                     policy_id TEXT PRIMARY KEY,
                     parent_policy_id TEXT,
                     created_at TEXT NOT NULL,
-                    parameters_json TEXT NOT NULL,
-                    sim_metrics_json TEXT NOT NULL,
+                    parameters_json BLOB NOT NULL,
+                    sim_metrics_json BLOB NOT NULL,
                     promotion_state TEXT NOT NULL,
                     score REAL NOT NULL,
-                    live_metrics_json TEXT NOT NULL
+                    live_metrics_json BLOB NOT NULL
                 )
                 """
             )
@@ -77,7 +90,7 @@ class PolicyRegistry:
                 """
                 CREATE TABLE IF NOT EXISTS runtime_state (
                     key TEXT PRIMARY KEY,
-                    value_json TEXT NOT NULL
+                    value_json BLOB NOT NULL
                 )
                 """
             )
@@ -88,8 +101,8 @@ class PolicyRegistry:
                     created_at TEXT NOT NULL,
                     loop_cursor INTEGER NOT NULL,
                     active_policy_id TEXT NOT NULL,
-                    population_state_json TEXT NOT NULL,
-                    failure_counters_json TEXT NOT NULL,
+                    population_state_json BLOB NOT NULL,
+                    failure_counters_json BLOB NOT NULL,
                     last_success_ts TEXT NOT NULL,
                     safe_pause INTEGER NOT NULL,
                     safe_pause_reason TEXT NOT NULL
@@ -102,14 +115,14 @@ class PolicyRegistry:
         if row is None:
             return default
         try:
-            return json.loads(str(row["value_json"]))
+            return loads(row["value_json"])
         except Exception:
             return default
 
     def _set_state(self, conn: sqlite3.Connection, key: str, value: Any) -> None:
         conn.execute(
             "INSERT INTO runtime_state(key, value_json) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value_json=excluded.value_json",
-            (key, json.dumps(value, ensure_ascii=True)),
+            (key, _encode(value)),
         )
 
     def _policy_manifest_path(self, policy_id: str) -> Path:
@@ -128,7 +141,7 @@ class PolicyRegistry:
             "score": record.score,
             "live_metrics": record.live_metrics,
         }
-        path.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+        path.write_bytes(dumps_bytes(payload, indent=True))
 
     def bootstrap_baseline(self) -> PolicyRecord:
         with self._session() as conn:
@@ -187,11 +200,11 @@ class PolicyRegistry:
                     record.policy_id,
                     record.parent_policy_id,
                     record.created_at,
-                    json.dumps(record.parameters.to_dict(), ensure_ascii=True),
-                    json.dumps(record.sim_metrics, ensure_ascii=True),
+                    _encode(record.parameters.to_dict()),
+                    _encode(record.sim_metrics),
                     record.promotion_state,
                     record.score,
-                    json.dumps(record.live_metrics, ensure_ascii=True),
+                    _encode(record.live_metrics),
                 ),
             )
         self._write_manifest(record)
@@ -213,7 +226,7 @@ class PolicyRegistry:
             ).fetchone()
             if row is None:
                 raise KeyError(f"unknown policy_id {policy_id}")
-            params = PolicyParameters.from_dict(json.loads(str(row["parameters_json"])))
+            params = PolicyParameters.from_dict(loads(row["parameters_json"]))
             conn.execute(
                 """
                 UPDATE policies
@@ -221,10 +234,10 @@ class PolicyRegistry:
                 WHERE policy_id = ?
                 """,
                 (
-                    json.dumps(sim_metrics, ensure_ascii=True),
+                    _encode(sim_metrics),
                     promotion_state,
                     float(score),
-                    json.dumps(live_metrics, ensure_ascii=True),
+                    _encode(live_metrics),
                     policy_id,
                 ),
             )
@@ -250,11 +263,11 @@ class PolicyRegistry:
             policy_id=str(row["policy_id"]),
             parent_policy_id=str(row["parent_policy_id"]) if row["parent_policy_id"] is not None else None,
             created_at=str(row["created_at"]),
-            parameters=PolicyParameters.from_dict(json.loads(str(row["parameters_json"]))),
-            sim_metrics=json.loads(str(row["sim_metrics_json"])),
+            parameters=PolicyParameters.from_dict(loads(row["parameters_json"])),
+            sim_metrics=loads(row["sim_metrics_json"]),
             promotion_state=str(row["promotion_state"]),
             score=float(row["score"]),
-            live_metrics=json.loads(str(row["live_metrics_json"])),
+            live_metrics=loads(row["live_metrics_json"]),
         )
 
     def list_recent_policies(self, limit: int = 20) -> list[PolicyRecord]:
@@ -268,11 +281,11 @@ class PolicyRegistry:
                 policy_id=str(r["policy_id"]),
                 parent_policy_id=str(r["parent_policy_id"]) if r["parent_policy_id"] is not None else None,
                 created_at=str(r["created_at"]),
-                parameters=PolicyParameters.from_dict(json.loads(str(r["parameters_json"]))),
-                sim_metrics=json.loads(str(r["sim_metrics_json"])),
+                parameters=PolicyParameters.from_dict(loads(r["parameters_json"])),
+                sim_metrics=loads(r["sim_metrics_json"]),
                 promotion_state=str(r["promotion_state"]),
                 score=float(r["score"]),
-                live_metrics=json.loads(str(r["live_metrics_json"])),
+                live_metrics=loads(r["live_metrics_json"]),
             )
             for r in rows
         ]
@@ -313,8 +326,8 @@ class PolicyRegistry:
         return CheckpointState(
             loop_cursor=int(row["loop_cursor"]),
             active_policy_id=str(row["active_policy_id"]),
-            population_state=json.loads(str(row["population_state_json"])),
-            failure_counters=json.loads(str(row["failure_counters_json"])),
+            population_state=loads(row["population_state_json"]),
+            failure_counters=loads(row["failure_counters_json"]),
             last_success_ts=str(row["last_success_ts"]),
             safe_pause=bool(int(row["safe_pause"])),
             safe_pause_reason=str(row["safe_pause_reason"]),
@@ -334,8 +347,8 @@ class PolicyRegistry:
                     utc_now_iso(),
                     int(state.loop_cursor),
                     state.active_policy_id,
-                    json.dumps(state.population_state, ensure_ascii=True),
-                    json.dumps(state.failure_counters, ensure_ascii=True),
+                    _encode(state.population_state),
+                    _encode(state.failure_counters),
                     state.last_success_ts,
                     1 if state.safe_pause else 0,
                     state.safe_pause_reason,
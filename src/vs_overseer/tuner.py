@@ -3,12 +3,11 @@ from __future__ import annotations
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 import random
-from typing import Callable
 
 from .config import AppConfig, ScoringConfig
 from .models import PolicyParameters, SimBatchMetrics
 from .scoring import weighted_score
-from .simulator import Simulator
+from .simulator import EpisodeCallback, Simulator
 
 
 @dataclass(frozen=True)
@@ -50,7 +49,7 @@ class PopulationTuner:
         seed_base: int,
         max_workers: int | None = None,
         scoring: ScoringConfig | None = None,
-        on_episode: Callable[[], None] | None = None,
+        on_episode: EpisodeCallback | None = None,
     ) -> list[CandidateResult]:
         worker_limit = self.cfg.runtime.max_parallel_workers if max_workers is None else max_workers
         workers = min(len(population), max(1, int(worker_limit)))
@@ -61,7 +60,7 @@ class PopulationTuner:
                 parameters=params,
                 episodes=episodes,
                 seed=seed_base + idx,
-                on_episode=(lambda _ep: on_episode()) if on_episode is not None else None,
+                on_episode=on_episode,
             )
             _ = rows
             score = weighted_score(metrics, scoring_cfg).total
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from vs_overseer.api import ControlBridge
+from vs_overseer.dashboard import write_json
+
+
+class ControlBridgeTests(unittest.TestCase):
+    def test_health_body_reuses_written_bytes(self) -> None:
+        bridge = ControlBridge()
+        payload = {"state": "RUNNING", "generation": 3}
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-test-") as td:
+            path = Path(td) / "health.json"
+            body = write_json(path, payload)
+            self.assertEqual(path.read_bytes(), body)
+        bridge.update_health(payload, body)
+        self.assertIs(bridge.get_health_body(), body)
+        self.assertEqual(bridge.get_health(), payload)
+
+    def test_body_falls_back_to_encoding_payload(self) -> None:
+        bridge = ControlBridge()
+        bridge.update_summary({"generation": 1})
+        self.assertEqual(json.loads(bridge.get_summary_body()), {"generation": 1})
+        self.assertEqual(json.loads(bridge.get_health_body()), {})
+
+    def test_control_request_wakes_waiter(self) -> None:
+        bridge = ControlBridge()
+        self.assertFalse(bridge.wait_for_request(0.01))
+        bridge.request_stop()
+        self.assertTrue(bridge.wait_for_request(5.0))
+        # The wake is consumed, so the next wait sleeps again.
+        self.assertFalse(bridge.wait_for_request(0.01))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import contextlib
 from datetime import datetime, timedelta, timezone
+import io
+import json
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
 import unittest
 
+from vs_overseer.config import load_config
 from vs_overseer.game_input import (
     _evaluate_arm_payload,
     _is_region_capture_retryable_error,
     _should_allow_unknown_menu_confirm,
     _should_treat_unknown_as_in_run,
+    _since,
     _text_has_menu_keywords,
     _token_to_osascript,
+    _write_bytes_atomic,
     GameInputDaemon,
     evaluate_nudge,
 )
@@ -84,6 +95,11 @@ class GameInputTests(unittest.TestCase):
         self.assertEqual(reason, "ready")
         self.assertEqual(cooldown, 0.0)
 
+    def test_since_treats_unset_timestamp_as_zero(self) -> None:
+        self.assertEqual(_since(100.0, 0.0), 0.0)
+        self.assertEqual(_since(100.0, 40.0), 60.0)
+        self.assertEqual(_since(100.0, 120.0), 0.0)
+
     def test_token_translation(self) -> None:
         self.assertEqual(_token_to_osascript("return"), "key code 36")
         self.assertEqual(_token_to_osascript("w"), "key code 13")
@@ -138,6 +154,27 @@ class GameInputTests(unittest.TestCase):
         self.assertTrue(ok3)
         self.assertEqual(reason3, "armed")
 
+    def test_arm_state_reports_menu_only(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-game-input-") as td:
+            daemon = GameInputDaemon.__new__(GameInputDaemon)
+            daemon.require_arm_file = True
+            daemon.arm_file = Path(td) / "arm.json"
+
+            missing = GameInputDaemon._arm_state(daemon)
+            self.assertFalse(missing.armed)
+            self.assertEqual(missing.reason, "arm_missing")
+            self.assertFalse(missing.menu_only)
+
+            expires = (datetime.now(timezone.utc) + timedelta(minutes=5)).isoformat()
+            daemon.arm_file.write_text(
+                json.dumps({"armed": True, "expires_at": expires, "menu_only": True}) + "\n",
+                encoding="utf-8",
+            )
+            armed = GameInputDaemon._arm_state(daemon)
+            self.assertTrue(armed.armed)
+            self.assertEqual(armed.reason, "armed")
+            self.assertTrue(armed.menu_only)
+
     def test_menu_classification(self) -> None:
         daemon = GameInputDaemon.__new__(GameInputDaemon)
         state1, _ = GameInputDaemon._classify_menu_state(daemon, "PRESS TO START")
@@ -170,6 +207,14 @@ class GameInputTests(unittest.TestCase):
         self.assertTrue(_text_has_menu_keywords("Already linked with account Login"))
         self.assertFalse(_text_has_menu_keywords("@ - (= Meat, WSS Tie pedi"))
 
+    def test_write_bytes_atomic_replaces_without_leftover_tmp(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-game-input-") as td:
+            path = Path(td) / "live" / "status.json"
+            _write_bytes_atomic(path, b'{"ok": false}\n')
+            _write_bytes_atomic(path, b'{"ok": true}\n', durable=True)
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), {"ok": True})
+            self.assertEqual(sorted(p.name for p in path.parent.iterdir()), ["status.json"])
+
     def test_region_capture_retryable_error(self) -> None:
         self.assertTrue(_is_region_capture_retryable_error("could not create image from rect"))
         self.assertTrue(_is_region_capture_retryable_error("invalid rect"))
@@ -517,6 +562,46 @@ class GameInputTests(unittest.TestCase):
         self.assertEqual(idx, 1)
         self.assertIn("objective_stage_prereq_for_missing:dairy_plant:inlaid_library", reason)
 
+    @unittest.skipUnless(Path("/proc/self/cmdline").exists(), "requires /proc")
+    def test_find_game_pids_scans_proc_cmdline(self) -> None:
+        marker = f"vsbotfresh-pid-scan-{id(self)}"
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)", marker])
+        try:
+            daemon = GameInputDaemon.__new__(GameInputDaemon)
+            daemon.app_name = marker
+            deadline = time.monotonic() + 5.0
+            pids: list[int] = []
+            while proc.pid not in pids and time.monotonic() < deadline:
+                daemon._proc_match_cache = {}
+                pids = daemon._find_game_pids()
+            self.assertIn(proc.pid, pids)
+            self.assertIn(proc.pid, daemon._find_game_pids())
+        finally:
+            proc.kill()
+            proc.wait()
+        self.assertNotIn(proc.pid, daemon._find_game_pids())
+
+    def test_disabled_tick_reuses_cached_status(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-game-input-") as td:
+            root = Path(td)
+            (root / "config").mkdir(parents=True, exist_ok=True)
+            cfg_path = root / "config" / "settings.toml"
+            cfg_path.write_text(
+                "[game_input]\nenabled = false\nmenu_detection_enabled = false\n"
+                'status_file = "runtime/live/game_input_status.json"\n',
+                encoding="utf-8",
+            )
+            daemon = GameInputDaemon(load_config(cfg_path))
+            with contextlib.redirect_stdout(io.StringIO()):
+                first = daemon.tick()
+                daemon._find_game_pids = lambda: self.fail("disabled tick should not scan processes")  # type: ignore[method-assign]
+                second = daemon.tick(force=True)
+            self.assertIs(first, second)
+            self.assertEqual(second.payload["decision_reason"], "disabled_by_config")
+            self.assertTrue(second.payload["force"])
+            status = json.loads((root / "runtime" / "live" / "game_input_status.json").read_text(encoding="utf-8"))
+            self.assertEqual(status["generated_at"], second.payload["generated_at"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,11 +3,15 @@ from __future__ import annotations
 import json
 from pathlib import Path
 import shutil
+import sqlite3
 import tempfile
+import threading
 import unittest
+from unittest import mock
 
 from vs_overseer.config import load_config
-from vs_overseer.orchestrator import Orchestrator
+from vs_overseer.orchestrator import Orchestrator, _JsonlAppender
+from vs_overseer.policy_registry import CheckpointState, PolicyRegistry
 
 
 class IntegrationLoopTests(unittest.TestCase):
@@ -90,11 +94,140 @@ stability_weight = 0.15
             self.assertIn("wiki_sync", payload)
             self.assertIn("game_input", payload)
 
+            # Event rows are written by a background appender and flushed on stop.
+            events = cfg.resolve(cfg.runtime.events_file).read_text(encoding="utf-8").splitlines()
+            rows = [json.loads(line) for line in events]
+            completed = [row for row in rows if row["phase"] == "generation" and row["event_type"] == "completed"]
+            self.assertEqual([row["payload"]["generation"] for row in completed], [1, 2])
+
+            # run() closes its registry connection on shutdown.
+            with self.assertRaises(sqlite3.ProgrammingError):
+                orch.registry.get_active_policy_id()
+
+            # Episode counts are batched in memory and persisted with the generation checkpoint.
+            registry = PolicyRegistry(orch.db_path, orch.policies_root)
+            counters = registry.load_checkpoint().failure_counters
+            registry.close()
+            self.assertGreater(int(counters.get("episodes_completed", 0)), 0)
+
             cfg2 = load_config(cfg_path)
             orch2 = Orchestrator(cfg2)
             second = orch2.run(max_generations=3, api_port=0, enable_api=False)
             self.assertEqual(second.generations_completed, 3)
 
+    def test_final_checkpoint_failure_still_shuts_down(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-test-") as td:
+            root = Path(td)
+            cfg = load_config(self._write_config(root))
+            orch = Orchestrator(cfg)
+
+            save = orch.registry.save_checkpoint
+
+            # Bootstrap saves succeed; every save after the first generation fails.
+            def _save_then_fail(state: CheckpointState) -> None:
+                if state.loop_cursor >= 1:
+                    raise sqlite3.OperationalError("database is locked")
+                save(state)
+
+            orch.registry.save_checkpoint = _save_then_fail  # type: ignore[method-assign]
+            with self.assertRaises(sqlite3.OperationalError):
+                orch.run(max_generations=1, api_port=0, enable_api=True)
+
+            server = orch._api_server
+            self.assertIsNotNone(server)
+            self.assertEqual(server.socket.fileno(), -1)
+
+            health = json.loads(cfg.resolve(cfg.reporting.status_file).read_text(encoding="utf-8"))
+            self.assertEqual(health["state"], "STOPPED")
+
+            events = cfg.resolve(cfg.runtime.events_file).read_text(encoding="utf-8").splitlines()
+            rows = [json.loads(line) for line in events]
+            failures = [row for row in rows if row["phase"] == "checkpoint" and row["event_type"] == "save_failed"]
+            self.assertTrue(any(row["payload"].get("final") for row in failures))
+            self.assertTrue(any(row["phase"] == "generation" and row["event_type"] == "completed" for row in rows))
+
+    def test_background_save_failure_blocks_next_generation(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-test-") as td:
+            root = Path(td)
+            cfg = load_config(self._write_config(root))
+            orch = Orchestrator(cfg)
+            save = orch.registry.save_checkpoint
+
+            def _fail(state: CheckpointState) -> None:
+                raise sqlite3.OperationalError("database is locked")
+
+            orch.registry.save_checkpoint = _fail  # type: ignore[method-assign]
+            orch._checkpoint.loop_cursor = 3
+            orch._checkpoint_dirty.set()
+            orch._checkpoint_wake.set()
+            heartbeat = threading.Thread(target=orch._heartbeat_loop, daemon=True)
+            heartbeat.start()
+            self.assertTrue(orch._checkpoint_failed.wait(5.0))
+            orch._heartbeat_stop.set()
+            orch._checkpoint_wake.set()
+            heartbeat.join(timeout=5.0)
+            self.assertIsInstance(orch._checkpoint_error, sqlite3.OperationalError)
+
+            # The main loop retries the save before running a generation and fails like one.
+            with self.assertRaises(sqlite3.OperationalError):
+                orch._check_background_save()
+            self.assertTrue(orch._checkpoint_dirty.is_set())
+
+            orch.registry.save_checkpoint = save  # type: ignore[method-assign]
+            orch._check_background_save()
+            self.assertFalse(orch._checkpoint_failed.is_set())
+            self.assertIsNone(orch._checkpoint_error)
+            self.assertEqual(orch.registry.load_checkpoint().loop_cursor, 3)
+            orch.registry.close()
+            orch._events.close()
+
+
+class EventLogTests(unittest.TestCase):
+    def _failing_log(self, root: Path) -> tuple[_JsonlAppender, threading.Event]:
+        # Holds the writer in mkdir until the gate opens, so rows queue before it fails.
+        path = root / "events.jsonl"
+        path.mkdir()
+        gate = threading.Event()
+        real_mkdir = Path.mkdir
+
+        def _gated_mkdir(self_path: Path, *args: object, **kwargs: object) -> None:
+            gate.wait(5.0)
+            real_mkdir(self_path, *args, **kwargs)
+
+        patcher = mock.patch.object(Path, "mkdir", _gated_mkdir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return _JsonlAppender(path), gate
+
+    def test_write_failure_reaches_caller_and_keeps_rows(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-test-") as td:
+            log, gate = self._failing_log(Path(td))
+            log.append({"seq": 0})
+            gate.set()
+            log._thread.join(timeout=5.0)
+            self.assertFalse(log._thread.is_alive())
+
+            # The writer died on the directory; appends now write synchronously and raise.
+            with self.assertRaises(IsADirectoryError):
+                log.append({"seq": 1})
+            self.assertIsNone(log._queue)
+
+            log.path.rmdir()
+            log.append({"seq": 2})
+            log.append({"seq": 3})
+            log.close()
+            rows = [json.loads(line) for line in log.path.read_text(encoding="utf-8").splitlines()]
+            self.assertEqual(rows, [{"seq": 2}, {"seq": 3}])
+
+    def test_close_reports_writer_failure(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-test-") as td:
+            log, gate = self._failing_log(Path(td))
+            log.append({"seq": 0})
+            gate.set()
+            with self.assertRaises(IsADirectoryError):
+                log.close()
+            self.assertIsNone(log._thread)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from vs_overseer import jsonio
+
+
+class JsonIoTests(unittest.TestCase):
+    def _assert_roundtrip(self) -> None:
+        payload = {"ok": True, "count": 3, "ratio": 0.5, "items": ["A", "B"], "nested": {"x": None}}
+        compact = jsonio.dumps_bytes(payload)
+        indented = jsonio.dumps_bytes(payload, indent=True)
+        self.assertTrue(compact.endswith(b"\n"))
+        self.assertEqual(compact.count(b"\n"), 1)
+        self.assertTrue(indented.endswith(b"\n"))
+        self.assertGreater(indented.count(b"\n"), 1)
+        self.assertEqual(jsonio.loads(compact), payload)
+        self.assertEqual(jsonio.loads(indented.decode("utf-8")), payload)
+        self.assertEqual(json.loads(indented), payload)
+        self.assertEqual(jsonio.loads(jsonio.dumps_bytes({1: "a"})), {"1": "a"})
+        bare = jsonio.dumps_bytes(payload, newline=False)
+        self.assertNotIn(b"\n", bare)
+        self.assertEqual(jsonio.loads(bare), payload)
+
+    def test_roundtrip(self) -> None:
+        self._assert_roundtrip()
+
+    def test_roundtrip_without_orjson(self) -> None:
+        with mock.patch.object(jsonio, "orjson", None):
+            self._assert_roundtrip()
+
+    def _assert_rejects_non_finite(self) -> None:
+        for value in (float("nan"), float("inf"), -float("inf")):
+            with self.assertRaises(ValueError):
+                jsonio.dumps_bytes({"metrics": {"score": value}})
+            with self.assertRaises(ValueError):
+                jsonio.dumps_bytes([[value]], indent=True)
+
+    def test_rejects_non_finite(self) -> None:
+        self._assert_rejects_non_finite()
+
+    def test_rejects_non_finite_without_orjson(self) -> None:
+        with mock.patch.object(jsonio, "orjson", None):
+            self._assert_rejects_non_finite()
+
+    def test_write_bytes_atomic_recreates_removed_parent(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-jsonio-") as td:
+            path = Path(td) / "live" / "signal.json"
+            jsonio.write_bytes_atomic(path, b"{}\n")
+            shutil.rmtree(path.parent)
+            jsonio.write_bytes_atomic(path, b'{"a": 1}\n', durable=True)
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), {"a": 1})
+            self.assertFalse(Path(f"{path}.tmp").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -141,6 +141,12 @@ stability_weight = 0.15
             self.assertFalse(out.blocked)
             self.assertTrue(out.reason.startswith("ok:save_data:"))
 
+            # The backend keeps its providers, so the parsed save is reused.
+            first = runner.memory.probe()
+            second = runner.memory.probe()
+            self.assertTrue(second.ok)
+            self.assertIs(first.signal.unlocked_characters, second.signal.unlocked_characters)  # type: ignore[union-attr]
+
     def test_auto_falls_back_to_env_gate(self) -> None:
         with tempfile.TemporaryDirectory(prefix="vsbotfresh-live-") as td:
             root = Path(td)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from dataclasses import replace
 import json
 from pathlib import Path
 import shutil
+import sys
 import tempfile
 import unittest
+from unittest import mock
 
+from vs_overseer import memory_backend
 from vs_overseer.config import load_config
-from vs_overseer.live_signal import generate_signal_once
+from vs_overseer.live_signal import _SaveFileWatcher, _signal_fingerprint, generate_signal_once
+from vs_overseer.memory_backend import SaveDataProvider, SignalFileProvider
 
 
 class LiveSignalTests(unittest.TestCase):
@@ -97,6 +102,86 @@ stability_weight = 0.15
             self.assertIn("stability_hint", payload)
             self.assertIn("unlocked_stages_count", payload)
             self.assertIn("save_data_age_seconds", payload)
+            self.assertEqual(payload["unlocked_characters"], ["A", "B"])
+
+    def test_generate_signal_once_can_omit_unlock_lists(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-signal-") as td:
+            root = Path(td)
+            cfg = load_config(self._write_config(root))
+            cfg = replace(cfg, live=replace(cfg.live, include_unlock_lists=False))
+            save_path = root / "runtime" / "save_data.json"
+            save_path.parent.mkdir(parents=True, exist_ok=True)
+            save_path.write_text(json.dumps({"UnlockedCharacters": ["A", "B"]}) + "\n", encoding="utf-8")
+
+            out = generate_signal_once(cfg)
+            self.assertTrue(out["ok"])
+            self.assertNotIn("unlocked_characters", out["payload"])
+            self.assertEqual(out["payload"]["unlocked_characters_count"], 2)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux-only")
+    def test_save_file_watcher_wakes_only_for_watched_file(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-watch-") as td:
+            root = Path(td)
+            watcher = _SaveFileWatcher(root / "save_data.json")
+            try:
+                self.assertTrue(watcher.active)
+                (root / "other.json").write_text("{}", encoding="utf-8")
+                self.assertFalse(watcher.wait(0.05))
+                (root / "save_data.json").write_text("{}", encoding="utf-8")
+                self.assertTrue(watcher.wait(1.0))
+            finally:
+                watcher.close()
+        self.assertFalse(_SaveFileWatcher(None).active)
+
+    def test_save_data_provider_reuses_parse_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-signal-") as td:
+            root = Path(td)
+            cfg = load_config(self._write_config(root))
+            save_path = root / "runtime" / "save_data.json"
+            save_path.parent.mkdir(parents=True, exist_ok=True)
+            save_path.write_text(json.dumps({"UnlockedCharacters": ["A"]}) + "\n", encoding="utf-8")
+
+            provider = SaveDataProvider(cfg)
+            first = provider.probe()
+            self.assertTrue(first.ok)
+            with mock.patch.object(memory_backend, "json_loads", side_effect=AssertionError("re-parsed")):
+                second = provider.probe()
+            self.assertTrue(second.ok)
+            self.assertEqual(second.signal.unlocked_characters, ["A"])
+
+            save_path.write_text(json.dumps({"UnlockedCharacters": ["A", "B"]}) + "\n", encoding="utf-8")
+            third = provider.probe()
+            self.assertEqual(third.signal.unlocked_characters_count, 2)
+
+    def test_signal_file_provider_decodes_generated_signal(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-signal-") as td:
+            root = Path(td)
+            cfg = load_config(self._write_config(root))
+            save_path = root / "runtime" / "save_data.json"
+            save_path.parent.mkdir(parents=True, exist_ok=True)
+            save_path.write_text(
+                json.dumps({"UnlockedCharacters": ["A", "B"], "UnlockedStages": ["FOREST"], "Achievements": ["X"]}) + "\n",
+                encoding="utf-8",
+            )
+            out = generate_signal_once(cfg)
+            self.assertTrue(out["ok"])
+
+            probe = SignalFileProvider(cfg).probe()
+            self.assertTrue(probe.ok)
+            signal = probe.signal
+            self.assertEqual(signal.unlocked_characters, ["A", "B"])
+            self.assertEqual(signal.unlocked_stages_count, 1)
+            self.assertEqual(signal.steam_achievements, 1)
+            self.assertAlmostEqual(signal.steam_achievements_ratio or 0.0, out["payload"]["steam_achievements_ratio"])
+            self.assertFalse(signal.save_data_stale)
+            self.assertEqual(signal.save_data_path, str(save_path))
+
+    def test_signal_fingerprint_ignores_volatile_fields(self) -> None:
+        base = {"generated_at": "t0", "save_data_age_seconds": 1.0, "unlocked_stages_count": 2}
+        same = {"generated_at": "t1", "save_data_age_seconds": 9.0, "unlocked_stages_count": 2}
+        changed = {"generated_at": "t1", "save_data_age_seconds": 9.0, "unlocked_stages_count": 3}
+        self.assertEqual(_signal_fingerprint(base), _signal_fingerprint(same))
+        self.assertNotEqual(_signal_fingerprint(base), _signal_fingerprint(changed))
 
     def test_generate_signal_once_blocked_writes_reason(self) -> None:
         with tempfile.TemporaryDirectory(prefix="vsbotfresh-signal-") as td:
@@ -6,6 +6,7 @@ from vs_overseer.memory_backend import (
     BESTIARY_TARGET_ENTRIES,
     COLLECTION_TARGET_ENTRIES,
     STEAM_ACHIEVEMENTS_TARGET,
+    _count_positive_values,
     signal_from_save_payload,
 )
 
@@ -67,6 +68,24 @@ class MemoryBackendSignalTests(unittest.TestCase):
         self.assertEqual(signal.unlocked_weapons_count, 0)
         self.assertEqual(signal.unlocked_passives_count, 0)
 
+    def test_count_positive_values_accepts_numbers_and_numeric_strings(self) -> None:
+        raw = {"A": 3, "B": 0, "C": 1.5, "D": "7", "E": "-2", "F": "x", "G": None, "H": [1], "I": -1}
+        self.assertEqual(_count_positive_values(raw), 3)
+        self.assertEqual(_count_positive_values([1, 2]), 0)
+
+    def test_sorted_cache_reuses_lists_for_unchanged_tokens(self) -> None:
+        cache: dict = {}
+        payload = {"UnlockedCharacters": ["B", "A"], "UnlockedWeapons": ["WHIP", "SPINACH"]}
+        first = signal_from_save_payload(payload, source="unit-test", sorted_cache=cache)
+        second = signal_from_save_payload(payload, source="unit-test", sorted_cache=cache)
+        self.assertEqual(first.unlocked_characters, ["A", "B"])
+        self.assertIs(first.unlocked_characters, second.unlocked_characters)
+        self.assertEqual(second.unlocked_passives, ["SPINACH"])
+
+        payload["UnlockedCharacters"] = ["C", "A"]
+        third = signal_from_save_payload(payload, source="unit-test", sorted_cache=cache)
+        self.assertEqual(third.unlocked_characters, ["A", "C"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import unittest
 from pathlib import Path
 
-from vs_overseer.objective_graph import ObjectiveGraph
+from vs_overseer.objective_graph import Objective, ObjectiveGraph
 
 
 class ObjectiveGraphTests(unittest.TestCase):
@@ -26,6 +26,17 @@ class ObjectiveGraphTests(unittest.TestCase):
         self.assertEqual(len(order), len(set(order)))
         self.assertEqual(order[0], "p01_unlock_bestiary")
 
+    def test_topological_order_breaks_ties_by_id(self) -> None:
+        def obj(oid: str, *deps: str) -> Objective:
+            return Objective(oid, oid, "misc", tuple(deps), "", 1.0, 1)
+
+        graph = ObjectiveGraph([obj("d", "a"), obj("c"), obj("b", "c"), obj("a")])
+        order = [x.id for x in graph.topological_order()]
+        self.assertEqual(order, ["a", "c", "b", "d"])
+        order.append("mutated")
+        self.assertEqual([x.id for x in graph.topological_order()], ["a", "c", "b", "d"])
+        self.assertEqual(graph.next_objective({"a"}).id, "c")
+
 
 if __name__ == "__main__":
     unittest.main()
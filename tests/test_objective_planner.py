@@ -5,7 +5,7 @@ from pathlib import Path
 import tempfile
 import unittest
 
-from vs_overseer.objective_planner import ObjectivePlanner
+from vs_overseer.objective_planner import ObjectivePlanner, _sanitize_token
 
 
 class ObjectivePlannerTests(unittest.TestCase):
@@ -87,6 +87,35 @@ class ObjectivePlannerTests(unittest.TestCase):
             self.assertEqual(len(planned), 1)
             self.assertEqual(planned[0].objective.id, "wiki_stage_count_2")
 
+    def test_plan_accepts_completed_ids_as_list(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-planner-") as td:
+            root = Path(td)
+            planner = ObjectivePlanner.load(self._write_mapping(root), rolling_window_size=6)
+            planned = planner.plan(
+                signal_payload={"unlocked_stages_count": 1},
+                completed_ids=["wiki_stage_count_2"],
+            )
+            self.assertEqual([item.objective.id for item in planned], [])
+
+    def test_load_reuses_planner_until_mapping_changes(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-planner-") as td:
+            root = Path(td)
+            path = self._write_mapping(root)
+            first = ObjectivePlanner.load(path, rolling_window_size=6)
+            self.assertIs(ObjectivePlanner.load(path, rolling_window_size=6), first)
+            self.assertIsNot(ObjectivePlanner.load(path, rolling_window_size=2), first)
+
+            path.write_text(json.dumps({"templates": []}) + "\n", encoding="utf-8")
+            reloaded = ObjectivePlanner.load(path, rolling_window_size=6)
+            self.assertIsNot(reloaded, first)
+            self.assertEqual(reloaded.templates, [])
+
+    def test_sanitize_token_collapses_separators(self) -> None:
+        self.assertEqual(_sanitize_token(" Wiki.Stage--Count "), "wiki_stage_count")
+        self.assertEqual(_sanitize_token("__a!!b__"), "a_b")
+        self.assertEqual(_sanitize_token("0.75"), "0_75")
+        self.assertEqual(_sanitize_token("***"), "goal")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import unittest
 
+from vs_overseer.objective_graph import Objective
 from vs_overseer.orchestrator import objective_unlock_met
 
 
@@ -64,6 +65,13 @@ class OrchestratorObjectiveSignalTests(unittest.TestCase):
         self.assertIsNone(objective_unlock_met("weapon_unlock:whip", payload))
         self.assertIsNone(objective_unlock_met("invalid", payload))
 
+    def test_parsed_unlock_matches_raw_signal(self) -> None:
+        obj = Objective("o1", "o1", "misc", (), " Has_Character : Imelda ", 1.0, 1)
+        self.assertEqual(obj.parsed_unlock, ("has_character", "imelda"))
+        payload = {"unlocked_characters": ["IMELDA"]}
+        self.assertTrue(bool(objective_unlock_met(obj.parsed_unlock, payload)))
+        self.assertIsNone(objective_unlock_met(None, payload))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from vs_overseer.models import PolicyParameters
+from vs_overseer.policy_registry import PolicyRegistry
+
+
+class PolicyRegistryTests(unittest.TestCase):
+    def test_checkpoint_and_policy_roundtrip(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-test-") as td:
+            root = Path(td)
+            registry = PolicyRegistry(root / "state.db", root / "policies")
+            baseline = registry.bootstrap_baseline()
+            self.assertEqual(registry.get_active_policy_id(), baseline.policy_id)
+
+            state = registry.load_checkpoint()
+            state.loop_cursor = 4
+            state.population_state = {"completed_objectives": ["a", "b"]}
+            state.failure_counters["episodes_completed"] = 12
+            registry.save_checkpoint(state)
+
+            loaded = registry.load_checkpoint()
+            self.assertEqual(loaded.loop_cursor, 4)
+            self.assertEqual(loaded.population_state, {"completed_objectives": ["a", "b"]})
+            self.assertEqual(loaded.failure_counters["episodes_completed"], 12)
+
+            record = registry.get_policy(baseline.policy_id)
+            self.assertIsNotNone(record)
+            self.assertEqual(record.parameters, baseline.parameters)
+            manifest = json.loads((root / "policies" / baseline.policy_id / "manifest.json").read_text(encoding="utf-8"))
+            self.assertEqual(manifest["policy_id"], baseline.policy_id)
+            registry.close()
+
+    def test_reads_rows_stored_as_text(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-test-") as td:
+            root = Path(td)
+            registry = PolicyRegistry(root / "state.db", root / "policies")
+            params = PolicyParameters(aggression=0.4, greed=0.5, safety=0.6, focus=0.7)
+            # Older databases stored the JSON columns as TEXT values.
+            conn = sqlite3.connect(str(root / "state.db"))
+            conn.execute(
+                "INSERT INTO policies VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ("legacy", None, "2025-01-01T00:00:00+00:00", json.dumps(params.to_dict()), "{}", "CANDIDATE", 1.5, "{}"),
+            )
+            conn.commit()
+            conn.close()
+
+            record = registry.get_policy("legacy")
+            self.assertIsNotNone(record)
+            self.assertEqual(record.parameters, params)
+            self.assertEqual(record.sim_metrics, {})
+            registry.close()
+
+    def test_saves_from_multiple_threads(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="vsbotfresh-test-") as td:
+            root = Path(td)
+            registry = PolicyRegistry(root / "state.db", root / "policies")
+            state = registry.load_checkpoint()
+
+            def _save(cursor: int) -> None:
+                state.loop_cursor = cursor
+                registry.save_checkpoint(state)
+
+            threads = [threading.Thread(target=_save, args=(i,)) for i in range(1, 9)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertIn(registry.load_checkpoint().loop_cursor, range(1, 9))
+            registry.close()
+
+
+if __name__ == "__main__":
+    unittest.main()